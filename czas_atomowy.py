@@ -11,9 +11,13 @@ import socket
 
 import ntplib
 from PyQt5.QtWidgets import QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QGraphicsRectItem
-from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtCore import Qt, QRectF, QObject, pyqtSignal
 from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QRadialGradient
 
+class SygnalySynchronizacji(QObject):
+    """Sygnały Qt zmiany stanu synchronizacji - emitowane z wątku synchronizacji"""
+    sync_status_changed = pyqtSignal(bool)
+
 class CzasAtomowy:
     """
     Klasa implementująca wizualizację czasu atomowego
@@ -32,6 +36,9 @@ class CzasAtomowy:
         self.sync_status = "Niesynchronizowany"
         self.is_sync = False
         
+        # Powiadamianie o zmianie stanu synchronizacji (zamiast odpytywania przez interfejs)
+        self.sync_signals = SygnalySynchronizacji()
+        
         # Ustawienia kolorów
         self.colors = {
             "background": QColor(30, 30, 60),
@@ -89,7 +96,7 @@ class CzasAtomowy:
                     # Aktualizacja statusu synchronizacji
                     self.last_sync_time = datetime.now()
                     self.sync_status = f"Zsynchronizowano z {server}"
-                    self.is_sync = True
+                    self.set_sync_state(True)
                     
                     # Sukces - przerywamy pętlę
                     return
@@ -99,12 +106,18 @@ class CzasAtomowy:
             
             # Wszystkie serwery zawiodły
             self.sync_status = "Błąd synchronizacji - serwery niedostępne"
-            self.is_sync = False
+            self.set_sync_state(False)
             
         except Exception as e:
             # Ogólny błąd synchronizacji
             self.sync_status = f"Błąd synchronizacji: {str(e)}"
-            self.is_sync = False
+            self.set_sync_state(False)
+    
+    def set_sync_state(self, is_sync):
+        """Ustawienie stanu synchronizacji i emisja sygnału tylko przy jego zmianie"""
+        if is_sync != self.is_sync:
+            self.is_sync = is_sync
+            self.sync_signals.sync_status_changed.emit(is_sync)
     
     def get_atomic_time(self):
         """Pobieranie aktualnego czasu atomowego"""
@@ -7,8 +7,8 @@ Odpowiada za rysowanie wszystkich systemów czasowych
 """
 
 import math
-from PyQt5.QtWidgets import QWidget, QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsTextItem
-from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsTextItem, QGraphicsPathItem
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QRadialGradient, QFont, QPainterPath
 
 # Klasa interaktywnego elementu
@@ -50,9 +50,10 @@ class InteraktywnyElement(QGraphicsEllipseItem):
         """Obsługa opuszczenia elementu przez mysz"""
         if self.info_text:
             scene = self.scene()
-            if scene:
+            # Tekst mógł zostać już usunięty przy odświeżeniu sceny (element trwały przetrwa odświeżenie)
+            if scene and self.info_text.scene() is scene:
                 scene.removeItem(self.info_text)
-                self.info_text = None
+            self.info_text = None
         super().hoverLeaveEvent(event)
         
     def mousePressEvent(self, event):
@@ -78,6 +79,33 @@ class InteraktywnyElement(QGraphicsEllipseItem):
             scene.addItem(scene.detail_text)
         super().mousePressEvent(event)
 
+# Klasa grupy elementów
+class GrupaElementow(QGraphicsRectItem):
+    """
+    Pusty element nadrzędny grupujący elementy sceny, np. w celu obracania ich jednym przekształceniem
+    W odróżnieniu od QGraphicsItemGroup nie przechwytuje zdarzeń elementów podrzędnych,
+    dzięki czemu InteraktywnyElement w grupie nadal reaguje na mysz
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
+
+# Klucz danych elementu sceny (QGraphicsItem.setData) oznaczający element trwały,
+# który nie jest usuwany przy każdym odświeżeniu wizualizacji, a jedynie ukrywany
+PERSISTENT_ITEM_KEY = 0
+
+def build_separator_path(size):
+    """Ścieżka okręgów separujących między systemami czasowymi"""
+    # Promienie dla poszczególnych systemów
+    radii = [size * 0.1, size * 0.2, size * 0.3, size * 0.4, size * 0.5, size * 0.6]
+    
+    # Okręgi separujące jako jedna ścieżka (bez separatora po ostatnim systemie)
+    path = QPainterPath()
+    for radius in radii[:-1]:
+        path.addEllipse(QPointF(0, 0), radius, radius)
+    
+    return path
+
 # Import systemów czasowych
 from systemy_czasowe.czas_lokalny import CzasLokalny
 from systemy_czasowe.czas_hebrajski import CzasHebrajski
@@ -110,15 +138,23 @@ class KoncentryczneOkregi(QGraphicsView):
         
         # Utworzenie sceny
         self.scene = QGraphicsScene(self)
+        
+        # Bez indeksu BSP - większość elementów jest dodawana i usuwana co klatkę,
+        # więc utrzymywanie drzewa kosztuje więcej niż liniowe wyszukiwanie przy najechaniu myszą
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         
         # Inicjalizacja systemów czasowych
         self.init_systems()
         
         # Konfiguracja timera dla aktualizacji - zwiększona częstotliwość
+        self.update_interval = 100  # Aktualizacja 10 razy na sekundę dla płynności (ms)
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_visualization)
-        self.update_timer.start(100)  # Aktualizacja 10 razy na sekundę dla płynności
+        self.update_timer.start(self.update_interval)
+        
+        # Zewnętrzny sygnał taktujący (np. zegar okna głównego) zastępujący własny timer
+        self._clock_signal = None
         
         # Śledzenie pozycji kliknięcia do interakcji
         self.last_click_pos = None
@@ -164,12 +200,18 @@ class KoncentryczneOkregi(QGraphicsView):
         # Inicjalizacja bazowych Z-indeksów dla każdego systemu
         for system_id, system_data in self.systems.items():
             system_data['instance'].base_z_index = system_data['z_index']
+        
+        # Trwały element separatorów budowany przy pierwszym rysowaniu
+        # Ścieżka zależy tylko od rozmiaru, więc jest odtwarzana wyłącznie po jego zmianie
+        self._separator_item = None
+        self._separator_size = None
+        self._separator_pen = QPen(QColor(50, 50, 70), 1)
     
     def update_visualization(self):
         """Aktualizacja wizualizacji - odświeżenie sceny"""
         if not self.animation_paused:
-            # Czyszczenie sceny przed ponownym rysowaniem
-            self.scene.clear()
+            # Czyszczenie sceny przed ponownym rysowaniem (elementy trwałe są tylko ukrywane)
+            self.clear_scene()
             
             # Pobranie aktualnego rozmiaru widoku
             size = min(self.width(), self.height()) * 0.9 * self.zoom_factor
@@ -197,6 +239,18 @@ class KoncentryczneOkregi(QGraphicsView):
                     self.draw_system(system_id, inner_radius, outer_radius, size)
                     inner_radius = outer_radius  # Kolejny system zaczyna się tam, gdzie kończy się poprzedni
     
+    def clear_scene(self):
+        """Usunięcie ze sceny elementów rysowanych od nowa - elementy trwałe są jedynie ukrywane"""
+        for item in self.scene.items():
+            # Elementy podrzędne są usuwane razem ze swoim rodzicem
+            if item.parentItem() is not None:
+                continue
+            
+            if item.data(PERSISTENT_ITEM_KEY):
+                item.setVisible(False)
+            else:
+                self.scene.removeItem(item)
+    
     def draw_background(self, size):
         """Rysowanie tła sceny"""
         # Główne tło - ciemny gradient radialny
@@ -210,17 +264,24 @@ class KoncentryczneOkregi(QGraphicsView):
     
     def draw_separators(self, size):
         """Rysowanie linii separujących między systemami czasowymi"""
-        # Promienie dla poszczególnych systemów
-        radii = [size * 0.1, size * 0.2, size * 0.3, size * 0.4, size * 0.5, size * 0.6]
+        if self._separator_item is None or self._separator_size != size:
+            # Zmiana rozmiaru - usunięcie poprzedniego elementu
+            if self._separator_item is not None:
+                self.scene.removeItem(self._separator_item)
+            
+            # Wszystkie okręgi jako jeden element ścieżki, buforowany w pamięci urządzenia
+            separator = QGraphicsPathItem(build_separator_path(size))
+            separator.setPen(self._separator_pen)
+            separator.setBrush(QBrush(Qt.NoBrush))
+            separator.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            separator.setZValue(50)  # Z-index dla separatorów
+            separator.setData(PERSISTENT_ITEM_KEY, True)
+            self.scene.addItem(separator)
+            
+            self._separator_item = separator
+            self._separator_size = size
         
-        # Rysowanie okręgów separujących
-        for i, radius in enumerate(radii):
-            if i < len(radii) - 1:  # Nie rysujemy separatora po ostatnim systemie
-                separator = QGraphicsEllipseItem(-radius, -radius, radius * 2, radius * 2)
-                separator.setPen(QPen(QColor(50, 50, 70), 1))
-                separator.setBrush(QBrush(Qt.NoBrush))
-                separator.setZValue(50)  # Z-index dla separatorów
-                self.scene.addItem(separator)
+        self._separator_item.setVisible(True)
     
     def draw_grid(self, size):
         """Rysowanie subtelnej siatki pomocniczej"""
@@ -263,6 +324,7 @@ class KoncentryczneOkregi(QGraphicsView):
             # Odświeżenie wizualizacji
             self.update_visualization()
     
+    @pyqtSlot(str)
     def update_timezone(self, timezone):
         """Aktualizacja strefy czasowej we wszystkich systemach"""
         self.timezone = timezone
@@ -343,10 +405,26 @@ class KoncentryczneOkregi(QGraphicsView):
     
     def cleanup(self):
         """Czyszczenie zasobów przy zamknięciu"""
-        # Zatrzymanie timera
-        self.update_timer.stop()
+        self.stop_updates()
         
         # Wywołanie metody cleanup dla każdego systemu
         for system_id, system_data in self.systems.items():
             if hasattr(system_data['instance'], 'cleanup'):
-                system_data['instance'].cleanup()
\ No newline at end of file
+                system_data['instance'].cleanup()
+    
+    def use_external_clock(self, clock_signal):
+        """Taktowanie wizualizacji zewnętrznym sygnałem zamiast własnego timera"""
+        # Jeden timer dla całej aplikacji - bez dwóch wybudzeń pętli zdarzeń w odstępie kilku milisekund
+        self.update_timer.stop()
+        self._clock_signal = clock_signal
+        self._clock_signal.connect(self.update_visualization, Qt.DirectConnection)
+    
+    def stop_updates(self):
+        """Zatrzymanie odświeżania wizualizacji"""
+        # Zatrzymanie timera
+        self.update_timer.stop()
+        
+        # Odłączenie zewnętrznego sygnału taktującego
+        if self._clock_signal is not None:
+            self._clock_signal.disconnect(self.update_visualization)
+            self._clock_signal = None
@@ -10,7 +10,7 @@ import sys
 import os
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt, QDir
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtGui import QFont
 from ui_mainwindow import MainWindow
 
 def setup_environment():
@@ -25,6 +25,15 @@ def setup_environment():
 
 def main():
     """Funkcja główna aplikacji"""
+    # Atrybuty aplikacji muszą być ustawione przed utworzeniem QApplication
+    # Włączenie wysokiej jakości antyaliasingu
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+    
+    # Łączenie serii zdarzeń wysokiej częstotliwości (ruch myszy, tablet) w jedno zdarzenie
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+    
     # Utworzenie aplikacji QT
     app = QApplication(sys.argv)
     app.setApplicationName("Aplikacja Czasowa")
@@ -70,10 +79,6 @@ def main():
     default_font = QFont("Segoe UI", 10)
     app.setFont(default_font)
     
-    # Włączenie wysokiej jakości antyaliasingu
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps)
-    app.setAttribute(Qt.AA_EnableHighDpiScaling)
-    
     # Utworzenie i wyświetlenie głównego okna
     window = MainWindow()
     window.show()
@@ -7,11 +7,28 @@ Prezentuje aktualną pozycję punktów na Ziemi względem Słońca
 """
 
 import math
+import re
+import numpy as np
 from datetime import datetime, timezone, timedelta
 from PyQt5.QtWidgets import QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QGraphicsPathItem, QGraphicsPolygonItem
 from PyQt5.QtCore import Qt, QRectF, QPointF
 from PyQt5.QtGui import QPolygonF
-from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QRadialGradient
+from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QRadialGradient, QTransform
+
+# Moduł widgetu definiuje InteraktywnyElement przed importem systemów czasowych,
+# dzięki czemu ten import na poziomie modułu nie tworzy problemu z importem cyklicznym
+from widgets.koncentryczne_okregi import InteraktywnyElement, GrupaElementow, PERSISTENT_ITEM_KEY
+
+# Strefa czasowa w postaci "UTC", "UTC+N" lub "UTC-N"
+_TZ_RE = re.compile(r'^UTC([+-]\d+)?$')
+
+def _project(lon_rad, lat_cos, rotation_angle, cx, cy, r):
+    """Rzutowanie punktów (długość w radianach, cosinus szerokości) na tarczę kuli ziemskiej"""
+    angles = lon_rad - rotation_angle
+    radii = r * lat_cos
+    xs = cx + radii * np.cos(angles)
+    ys = cy + radii * np.sin(angles)
+    return xs, ys
 
 class ObrotZiemi:
     """
@@ -24,6 +41,9 @@ class ObrotZiemi:
         # Aktualna strefa czasowa - domyślnie lokalna
         self.timezone = None
         
+        # Przesunięcie względem UTC sparsowane w set_timezone (None - czas lokalny)
+        self._tz_offset = None
+        
         # Opcje wyświetlania
         self.show_labels = True
         self.show_details = True
@@ -35,6 +55,65 @@ class ObrotZiemi:
         # Inicjalizacja danych o kontynentach i miastach
         self.init_continents_data()
         self.init_cities_data()
+        
+        # Niezmienne obiekty stylu budowane raz i współdzielone przez wszystkie klatki
+        self.init_styles()
+        
+        # Parametr łuku kontynentu - 21 punktów od -1/2 do +1/2 rozpiętości kątowej
+        self._arc_param = np.linspace(-0.5, 0.5, 21)
+        
+        # Geometria siatki geograficznej zależy tylko od promieni i liczby linii
+        self._grid_cache = {}
+        
+        # Nachylenie osi zmienia się raz na dobę - (dzień jako liczba porządkowa, nachylenie)
+        self._tilt_cache = (None, None)
+        
+        # Tekst panelu informacyjnego zmienia się co sekundę - (klucz, tekst)
+        self._info_cache = (None, None)
+        
+        # Trwały element tekstowy panelu - tworzony raz, w kolejnych klatkach zmieniany jest tylko tekst
+        self._time_display = None
+        self._time_display_text = None
+        
+        # Trwałe elementy sceny - tworzone raz i tylko pokazywane/obracane w kolejnych klatkach
+        # Wszystkie zależą wyłącznie od geometrii pierścienia
+        self._static_key = None
+        self._static_group = None
+        self._night_item = None
+        self._terminator_item = None
+        self._axis_item = None
+        self._grid_items = []
+        
+        # Grupa obracana zgodnie z obrotem Ziemi - kontynenty i miasta rysowane w układzie długości geograficznej
+        self._rotating_group = None
+        self._continent_labels = []
+        self._city_items = []
+    
+    def init_styles(self):
+        """Inicjalizacja piór, pędzli i czcionek używanych przy rysowaniu"""
+        self._globe_pen = QPen(QColor(100, 150, 200), 1)
+        
+        self._axis_pen = QPen(QColor(200, 200, 220), 1)
+        self._axis_pen.setStyle(Qt.DashLine)
+        
+        self._night_pen = QPen(QColor(50, 50, 100), 1)
+        
+        self._terminator_pen = QPen(QColor(100, 100, 180), 2)
+        self._terminator_pen.setStyle(Qt.DashLine)
+        
+        # Półprzezroczyste linie siatki geograficznej
+        self._meridian_pen = QPen(QColor(100, 100, 150, 80), 1)
+        self._meridian_pen.setStyle(Qt.DotLine)
+        self._parallel_pen = QPen(QColor(100, 100, 150, 80), 1)
+        self._parallel_pen.setStyle(Qt.DotLine)
+        
+        self._info_pen = QPen(QColor(150, 150, 200), 1)
+        self._no_pen = QPen(Qt.NoPen)
+        self._no_brush = QBrush(Qt.NoBrush)
+        self._city_brush = QBrush(QColor(255, 200, 0))  # Żółty punkt
+        
+        self._time_font = QFont("Arial", 8)
+        self._time_color = QColor(200, 200, 220)
     
     def init_continents_data(self):
         """Inicjalizacja danych o kontynentach"""
@@ -49,6 +128,10 @@ class ObrotZiemi:
             {"name": "Australia", "longitude": 135, "span": 30, "color": QColor(180, 120, 60)},
             {"name": "Antarktyda", "longitude": 0, "span": 360, "color": QColor(200, 200, 220)}
         ]
+        
+        # Pióro konturu przechowywane razem z danymi kontynentu - kolor jest już obiektem QColor
+        for continent in self.continents:
+            continent["_pen"] = QPen(continent["color"], 1)
     
     def init_cities_data(self):
         """Inicjalizacja danych o miastach"""
@@ -63,28 +146,19 @@ class ObrotZiemi:
             {"name": "Kair", "longitude": 31.2, "latitude": 30.0, "timezone": "Africa/Cairo"},
             {"name": "Moskwa", "longitude": 37.6, "latitude": 55.75, "timezone": "Europe/Moscow"}
         ]
+        
+        # Współrzędne miast w postaci tablic (długość w radianach, cosinus szerokości)
+        # do wektorowego rzutowania wszystkich miast naraz
+        self._city_lon = np.array([city["longitude"] for city in self.cities]) * (np.pi / 180)
+        self._city_lat_cos = np.cos(np.array([city["latitude"] for city in self.cities]) * (np.pi / 180))
     
     def get_current_earth_rotation(self):
         """Obliczenie aktualnego obrotu Ziemi"""
-        # Pobieramy aktualną datę i czas
-        now = datetime.now()
-        
-        # Zastosowanie strefy czasowej, jeśli została ustawiona
-        if self.timezone and self.timezone != "Lokalna":
-            if self.timezone.startswith("UTC"):
-                # Parsowanie przesunięcia UTC
-                try:
-                    if "+" in self.timezone:
-                        offset = int(self.timezone.split("+")[1])
-                        now = datetime.now(timezone.utc) + timedelta(hours=offset)
-                    elif "-" in self.timezone:
-                        offset = int(self.timezone.split("-")[1])
-                        now = datetime.now(timezone.utc) - timedelta(hours=offset)
-                    else:
-                        now = datetime.now(timezone.utc)
-                except Exception:
-                    # W przypadku błędu użyj czasu lokalnego
-                    pass
+        # Pobieramy aktualną datę i czas z uwzględnieniem strefy czasowej
+        if self._tz_offset is not None:
+            now = datetime.now(timezone.utc) + self._tz_offset
+        else:
+            now = datetime.now()
         
         # Obliczamy kąt obrotu Ziemi (południk Greenwich = 0 stopni)
         # Pełny obrót (360 stopni) zajmuje 24 godziny
@@ -92,24 +166,49 @@ class ObrotZiemi:
         angle = (now.hour * 15) + (now.minute * 0.25) + (now.second * 0.00417)
         
         # Uwzględniamy datę (dzień w roku) dla kąta nachylenia osi Ziemi
-        # Upraszaczamy, zakładając że maksymalne nachylenie to 23.5 stopnia
-        day_of_year = now.timetuple().tm_yday  # Dzień roku (1-366)
-        
-        # Obliczenie nachylenia osi (zależy od dnia w roku)
-        # Maksymalne nachylenie w przesilenia (21 czerwca i 21 grudnia)
-        # Dzień 172 to mniej więcej 21 czerwca, dzień 355 to mniej więcej 21 grudnia
-        days_from_spring = (day_of_year - 80) % 365  # 80 to mniej więcej 21 marca (równonoc wiosenna)
-        tilt_angle = 23.5 * math.sin(2 * math.pi * days_from_spring / 365)
+        # Nachylenie liczymy tylko raz na dobę - w pozostałych klatkach korzystamy z pamięci podręcznej
+        day_key = now.toordinal()
+        if day_key == self._tilt_cache[0]:
+            tilt_angle = self._tilt_cache[1]
+        else:
+            # Upraszaczamy, zakładając że maksymalne nachylenie to 23.5 stopnia
+            day_of_year = now.timetuple().tm_yday  # Dzień roku (1-366)
+            
+            # Obliczenie nachylenia osi (zależy od dnia w roku)
+            # Maksymalne nachylenie w przesilenia (21 czerwca i 21 grudnia)
+            # Dzień 172 to mniej więcej 21 czerwca, dzień 355 to mniej więcej 21 grudnia
+            days_from_spring = (day_of_year - 80) % 365  # 80 to mniej więcej 21 marca (równonoc wiosenna)
+            tilt_angle = 23.5 * math.sin(2 * math.pi * days_from_spring / 365)
+            self._tilt_cache = (day_key, tilt_angle)
+        
+        # Kąty w obu jednostkach liczone raz na klatkę - metody rysujące tylko je odczytują
+        # Noc jest po przeciwnej stronie Słońca - zaczyna się 90 stopni przed kątem obrotu
+        rotation_angle_rad = math.radians(angle)
+        night_start_angle_rad = rotation_angle_rad - math.pi/2
         
         return {
             "rotation_angle": angle,
+            "rotation_angle_rad": rotation_angle_rad,
+            "night_start_angle_rad": night_start_angle_rad,
+            "night_start_angle_deg": angle - 90,
             "tilt_angle": tilt_angle,
             "date": now
         }
     
     def set_timezone(self, timezone):
         """Ustawienie strefy czasowej"""
+        # Metoda jest wywoływana przy każdym rysowaniu - parsujemy tylko po zmianie strefy
+        if timezone == self.timezone:
+            return
+        
         self.timezone = timezone
+        
+        # Parsowanie przesunięcia UTC - dla innych wartości używamy czasu lokalnego
+        match = _TZ_RE.match(timezone) if timezone else None
+        if match:
+            self._tz_offset = timedelta(hours=int(match.group(1) or 0))
+        else:
+            self._tz_offset = None
     
     def set_display_options(self, show_labels=True, show_details=False, style="Klasyczny"):
         """Ustawienie opcji wyświetlania"""
@@ -126,27 +225,82 @@ class ObrotZiemi:
         # Pobranie aktualnego obrotu Ziemi
         earth_rotation = self.get_current_earth_rotation()
         
-        # Rysowanie tła (kula ziemska)
-        self.draw_earth_globe(scene, center_x, center_y, inner_radius, outer_radius)
+        # Rysowanie trwałej warstwy statycznej (kula ziemska, oś, siatka, kontynenty i miasta)
+        self.draw_static_layer(scene, center_x, center_y, inner_radius, outer_radius)
         
-        # Rysowanie linii terminatora (granica dnia i nocy)
-        self.draw_day_night_terminator(scene, center_x, center_y, inner_radius, outer_radius, earth_rotation)
-        
-        # Rysowanie kontynentów
-        self.draw_continents(scene, center_x, center_y, inner_radius, outer_radius, earth_rotation)
+        # Obrót kontynentów i miast jednym przekształceniem całej grupy
+        self._rotating_group.setRotation(-earth_rotation["rotation_angle"])
         
-        # Rysowanie siatki geograficznej (południki i równoleżniki)
-        if self.show_labels:
-            self.draw_geographic_grid(scene, center_x, center_y, inner_radius, outer_radius)
+        # Elementy rysowane w każdej klatce trafiają do wspólnej grupy dodawanej do sceny jednym wywołaniem
+        frame_group = GrupaElementow()
+        frame_group.setZValue(self.base_z_index)
         
-        # Rysowanie miast
-        if self.show_details:
-            self.draw_cities(scene, center_x, center_y, inner_radius, outer_radius, earth_rotation)
+        # Rysowanie linii terminatora (granica dnia i nocy)
+        self.draw_day_night_terminator(frame_group, center_x, center_y, inner_radius, outer_radius, earth_rotation)
         
         # Rysowanie informacji o aktualnym czasie
-        self.draw_time_info(scene, center_x, center_y, inner_radius, outer_radius, earth_rotation)
+        self.draw_time_info(scene, frame_group, center_x, center_y, inner_radius, outer_radius, earth_rotation)
+        
+        scene.addItem(frame_group)
+    
+    def add_persistent_item(self, scene, item):
+        """Dodanie do sceny elementu trwałego, który nie jest usuwany przy odświeżaniu widoku"""
+        item.setData(PERSISTENT_ITEM_KEY, True)
+        scene.addItem(item)
     
-    def draw_earth_globe(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_static_layer(self, scene, center_x, center_y, inner_radius, outer_radius):
+        """Rysowanie elementów statycznych - budowanych od nowa tylko po zmianie geometrii"""
+        key = (center_x, center_y, inner_radius, outer_radius)
+        
+        if key != self._static_key or self._static_group.scene() is not scene:
+            # Usunięcie elementów zbudowanych dla poprzedniej geometrii (razem z grupą)
+            if self._static_group is not None and self._static_group.scene() is not None:
+                self._static_group.scene().removeItem(self._static_group)
+            
+            # Grupa nadrzędna wszystkich elementów trwałych - dodawana do sceny jednym wywołaniem
+            self._static_group = GrupaElementow()
+            self._static_group.setZValue(self.base_z_index)
+            self._grid_items = []
+            self._continent_labels = []
+            self._city_items = []
+            
+            # Rysowanie tła (kula ziemska)
+            self.draw_earth_globe(center_x, center_y, inner_radius, outer_radius)
+            
+            # Rysowanie siatki geograficznej (południki i równoleżniki)
+            self.draw_geographic_grid(center_x, center_y, inner_radius, outer_radius)
+            
+            # Półkole nocy i linia terminatora - obracane w każdej klatce
+            self.build_day_night_items(center_x, center_y, inner_radius, outer_radius)
+            
+            # Grupa obracana wokół środka kuli ziemskiej - nad Antarktydą (base + 8),
+            # aby etykiety kontynentów i miasta pozostały nad czapą polarną
+            self._rotating_group = GrupaElementow()
+            self._rotating_group.setTransformOriginPoint(center_x, center_y)
+            self._rotating_group.setZValue(self.base_z_index + 9)
+            self._rotating_group.setParentItem(self._static_group)
+            
+            # Rysowanie kontynentów
+            self.draw_continents(center_x, center_y, inner_radius, outer_radius)
+            
+            # Rysowanie miast
+            self.draw_cities(center_x, center_y, inner_radius, outer_radius)
+            
+            # Dodanie całej warstwy do sceny po zbudowaniu elementów podrzędnych
+            self.add_persistent_item(scene, self._static_group)
+            self._static_key = key
+        
+        # Elementy trwałe są ukrywane przy odświeżaniu sceny - pokazujemy grupę i te elementy, które są włączone
+        self._static_group.setVisible(True)
+        self._axis_item.setVisible(self.show_details)
+        for item in self._grid_items:
+            item.setVisible(self.show_labels)
+        for item in self._continent_labels:
+            item.setVisible(self.show_labels)
+        for item in self._city_items:
+            item.setVisible(self.show_details)
+    
+    def draw_earth_globe(self, center_x, center_y, inner_radius, outer_radius):
         """Rysowanie kuli ziemskiej"""
         # Średni promień kuli ziemskiej
         globe_radius = (inner_radius + outer_radius) / 2
@@ -156,87 +310,85 @@ class ObrotZiemi:
                                    globe_radius * 2, globe_radius * 2)
         
         # Ustawienie stylu kuli
-        globe_pen = QPen(QColor(100, 150, 200))
-        globe_pen.setWidth(1)
-        globe.setPen(globe_pen)
+        globe.setPen(self._globe_pen)
         
         # Brak wypełnienia globu - tylko kontur
-        globe.setBrush(QBrush(Qt.NoBrush))
+        globe.setBrush(self._no_brush)
         
-        # Dodanie do sceny
+        # Dodanie do warstwy statycznej
         globe.setZValue(self.base_z_index + 1)
-        scene.addItem(globe)
+        globe.setParentItem(self._static_group)
         
-        # Rysowanie osi obrotu (opcjonalnie)
-        if self.show_details:
-            # Oś od bieguna północnego do południowego
-            axis_length = globe_radius * 1.2
-            axis = QGraphicsLineItem(center_x, center_y - axis_length, center_x, center_y + axis_length)
-            
-            # Ustawienie stylu osi
-            axis_pen = QPen(QColor(200, 200, 220))
-            axis_pen.setWidth(1)
-            axis_pen.setStyle(Qt.DashLine)
-            axis.setPen(axis_pen)
-            
-            # Dodanie do sceny
-            axis.setZValue(self.base_z_index)  # Pod kulą ziemską
-            scene.addItem(axis)
+        # Rysowanie osi obrotu (widoczna tylko przy włączonych szczegółach)
+        # Oś od bieguna północnego do południowego
+        axis_length = globe_radius * 1.2
+        axis = QGraphicsLineItem(center_x, center_y - axis_length, center_x, center_y + axis_length)
+        
+        # Ustawienie stylu osi
+        axis.setPen(self._axis_pen)
+        
+        # Dodanie do warstwy statycznej
+        axis.setZValue(self.base_z_index)  # Pod kulą ziemską
+        axis.setParentItem(self._static_group)
+        self._axis_item = axis
     
-    def draw_day_night_terminator(self, scene, center_x, center_y, inner_radius, outer_radius, earth_rotation):
-        """Rysowanie linii terminatora (granica dnia i nocy)"""
+    def build_day_night_items(self, center_x, center_y, inner_radius, outer_radius):
+        """Utworzenie półkola nocy i linii terminatora w położeniu bazowym (kąt 0)"""
         # Średni promień kuli ziemskiej
         globe_radius = (inner_radius + outer_radius) / 2
         
-        # Kąt obrotu Ziemi w radianach (konwersja ze stopni)
-        rotation_angle = math.radians(earth_rotation["rotation_angle"])
-        
-        # Rysowanie półkola dla nocy
-        # Noc jest po przeciwnej stronie Słońca
-        night_start_angle = rotation_angle - math.pi/2
-        night_span_angle = math.pi  # 180 stopni
-        
-        # Rysowanie obszaru nocy
+        # Rysowanie półkola dla nocy - kształt stały, zmienia się tylko jego obrót
+        # Ścieżka budowana w rzeczywistym promieniu, bo skalowanie elementu skalowałoby też grubość pióra
         night_path = QPainterPath()
         night_path.arcMoveTo(center_x - globe_radius, center_y - globe_radius, 
-                            globe_radius * 2, globe_radius * 2, 
-                            math.degrees(night_start_angle))
+                            globe_radius * 2, globe_radius * 2, 0)
         night_path.arcTo(center_x - globe_radius, center_y - globe_radius, 
-                        globe_radius * 2, globe_radius * 2, 
-                        math.degrees(night_start_angle), math.degrees(night_span_angle))
+                        globe_radius * 2, globe_radius * 2, 0, 180)
         
         # Utworzenie półkola nocy
         night = QGraphicsPathItem(night_path)
+        night.setTransformOriginPoint(center_x, center_y)
         
         # Ustawienie stylu obszaru nocy
-        night_pen = QPen(QColor(50, 50, 100))
-        night_pen.setWidth(1)
-        night.setPen(night_pen)
+        night.setPen(self._night_pen)
         
         # Bez wypełnienia dla obszaru nocy
-        night.setBrush(QBrush(Qt.NoBrush))
+        night.setBrush(self._no_brush)
         
-        # Dodanie do sceny
+        # Dodanie do warstwy statycznej
         night.setZValue(self.base_z_index + 5)  # Nad kulą ziemską, pod kontynentami
-        scene.addItem(night)
-        
-        # Rysowanie linii terminatora (granica dnia i nocy)
-        terminator_start_x = center_x + globe_radius * math.cos(night_start_angle)
-        terminator_start_y = center_y + globe_radius * math.sin(night_start_angle)
-        terminator_end_x = center_x + globe_radius * math.cos(night_start_angle + night_span_angle)
-        terminator_end_y = center_y + globe_radius * math.sin(night_start_angle + night_span_angle)
+        night.setParentItem(self._static_group)
+        self._night_item = night
         
-        terminator = QGraphicsLineItem(terminator_start_x, terminator_start_y, terminator_end_x, terminator_end_y)
+        # Rysowanie linii terminatora (granica dnia i nocy) - średnica kuli
+        terminator = QGraphicsLineItem(center_x + globe_radius, center_y, center_x - globe_radius, center_y)
+        terminator.setTransformOriginPoint(center_x, center_y)
         
         # Ustawienie stylu linii terminatora
-        terminator_pen = QPen(QColor(100, 100, 180))
-        terminator_pen.setWidth(2)
-        terminator_pen.setStyle(Qt.DashLine)
-        terminator.setPen(terminator_pen)
+        terminator.setPen(self._terminator_pen)
         
-        # Dodanie do sceny
+        # Dodanie do warstwy statycznej
         terminator.setZValue(self.base_z_index + 6)
-        scene.addItem(terminator)
+        terminator.setParentItem(self._static_group)
+        self._terminator_item = terminator
+    
+    def draw_day_night_terminator(self, group, center_x, center_y, inner_radius, outer_radius, earth_rotation):
+        """Rysowanie linii terminatora (granica dnia i nocy)"""
+        # Średni promień kuli ziemskiej
+        globe_radius = (inner_radius + outer_radius) / 2
+        
+        # Kąt obrotu Ziemi w radianach
+        rotation_angle = earth_rotation["rotation_angle_rad"]
+        
+        # Noc jest po przeciwnej stronie Słońca
+        night_start_angle = earth_rotation["night_start_angle_rad"]
+        
+        # Obrót półkola nocy - łuk Qt liczony jest przeciwnie do ruchu wskazówek zegara,
+        # dlatego kąt początkowy łuku odpowiada obrotowi elementu o kąt przeciwny
+        self._night_item.setRotation(-earth_rotation["night_start_angle_deg"])
+        
+        # Obrót linii terminatora - od kąta początku nocy przez środek kuli
+        self._terminator_item.setRotation(earth_rotation["night_start_angle_deg"])
         
         # Dodanie etykiet "Dzień" i "Noc"
         if self.show_labels:
@@ -246,7 +398,6 @@ class ObrotZiemi:
             day_label_y = center_y + globe_radius * 0.7 * math.sin(day_label_angle)
             
             # Utworzenie interaktywnego elementu dla dnia
-            from widgets.koncentryczne_okregi import InteraktywnyElement
             day_label = InteraktywnyElement(
                 day_label_x - 20, day_label_y - 10, 40, 20,
                 "DZIEŃ",
@@ -254,15 +405,15 @@ class ObrotZiemi:
             )
             
             # Ukrycie tła elementu interaktywnego
-            day_label.setPen(QPen(Qt.NoPen))
-            day_label.setBrush(QBrush(Qt.NoBrush))
+            day_label.setPen(self._no_pen)
+            day_label.setBrush(self._no_brush)
             
-            # Dodanie do sceny
+            # Dodanie do grupy klatki
             day_label.setZValue(self.base_z_index + 10)
-            scene.addItem(day_label)
+            day_label.setParentItem(group)
             
             # Pozycja etykiety "Noc" (środek nocy)
-            night_label_angle = rotation_angle - math.pi/2
+            night_label_angle = night_start_angle
             night_label_x = center_x + globe_radius * 0.7 * math.cos(night_label_angle)
             night_label_y = center_y + globe_radius * 0.7 * math.sin(night_label_angle)
             
@@ -274,25 +425,22 @@ class ObrotZiemi:
             )
             
             # Ukrycie tła elementu interaktywnego
-            night_label.setPen(QPen(Qt.NoPen))
-            night_label.setBrush(QBrush(Qt.NoBrush))
+            night_label.setPen(self._no_pen)
+            night_label.setBrush(self._no_brush)
             
-            # Dodanie do sceny
+            # Dodanie do grupy klatki
             night_label.setZValue(self.base_z_index + 10)
-            scene.addItem(night_label)
+            night_label.setParentItem(group)
     
-    def draw_continents(self, scene, center_x, center_y, inner_radius, outer_radius, earth_rotation):
-        """Rysowanie kontynentów"""
+    def draw_continents(self, center_x, center_y, inner_radius, outer_radius):
+        """Rysowanie kontynentów w układzie długości geograficznej (obrót nadaje grupa)"""
         # Średni promień kuli ziemskiej
         globe_radius = (inner_radius + outer_radius) / 2
         
-        # Kąt obrotu Ziemi w radianach (konwersja ze stopni)
-        rotation_angle = math.radians(earth_rotation["rotation_angle"])
-        
         # Rysowanie każdego kontynentu
         for continent in self.continents:
-            # Kąt kontynentu (uwzględniając obrót Ziemi)
-            continent_angle = math.radians(continent["longitude"]) - rotation_angle
+            # Kąt kontynentu (długość geograficzna - obrót Ziemi uwzględnia grupa)
+            continent_angle = math.radians(continent["longitude"])
             
             # Określenie rozpiętości kątowej kontynentu
             span_angle = math.radians(continent["span"])
@@ -302,6 +450,7 @@ class ObrotZiemi:
             
             if is_antarctica:
                 # Antarktyda jest na biegunie południowym - rysujemy jako czapę polarną
+                # Biegun nie obraca się razem z Ziemią, więc czapa nie należy do grupy
                 cap_radius = globe_radius * 0.3  # Mniejszy rozmiar
                 antarctica = QGraphicsEllipseItem(
                     center_x - cap_radius, center_y + globe_radius * 0.7 - cap_radius,
@@ -309,47 +458,35 @@ class ObrotZiemi:
                 )
                 
                 # Ustawienie stylu - tylko kontur bez wypełnienia
-                continent_pen = QPen(QColor(continent["color"]))
-                continent_pen.setWidth(1)
-                antarctica.setPen(continent_pen)
-                antarctica.setBrush(QBrush(Qt.NoBrush))
+                antarctica.setPen(continent["_pen"])
+                antarctica.setBrush(self._no_brush)
                 
-                # Dodanie do sceny
+                # Dodanie do warstwy statycznej
                 antarctica.setZValue(self.base_z_index + 8)
-                scene.addItem(antarctica)
+                antarctica.setParentItem(self._static_group)
             else:
                 # Rysowanie pozostałych kontynentów jako sektorów koła
                 # Tworzymy wielokąt reprezentujący kontynent
-                continent_polygon = QPolygonF()
+                # Kąty wszystkich punktów łuku obliczane jednocześnie
+                angles = continent_angle + span_angle * self._arc_param
                 
-                # Dodanie punktu środkowego
-                continent_polygon.append(QPointF(center_x, center_y))
-                
-                # Określenie liczby punktów do narysowania łuku kontynentu
-                num_points = 20
-                
-                # Dodanie punktów łuku
-                for i in range(num_points + 1):
-                    point_angle = continent_angle - span_angle/2 + i * span_angle / num_points
-                    x = center_x + globe_radius * math.cos(point_angle)
-                    y = center_y + globe_radius * math.sin(point_angle)
-                    continent_polygon.append(QPointF(x, y))
+                # Wielokąt budowany jednym wywołaniem z gotowej listy punktów (punkt środkowy + punkty łuku)
+                arc_x, arc_y = _project(angles, 1.0, 0.0, center_x, center_y, globe_radius)
+                continent_polygon = QPolygonF([QPointF(center_x, center_y)] +
+                                              [QPointF(x, y) for x, y in zip(arc_x.tolist(), arc_y.tolist())])
                 
                 # Utworzenie elementu wielokąta
                 continent_item = QGraphicsPolygonItem(continent_polygon)
                 
                 # Ustawienie stylu - tylko kontur bez wypełnienia
-                continent_pen = QPen(QColor(continent["color"]))
-                continent_pen.setWidth(1)
-                continent_item.setPen(continent_pen)
-                continent_item.setBrush(QBrush(Qt.NoBrush))
+                continent_item.setPen(continent["_pen"])
+                continent_item.setBrush(self._no_brush)
                 
-                # Dodanie do sceny
+                # Dodanie do obracanej grupy
                 continent_item.setZValue(self.base_z_index + 7)
-                scene.addItem(continent_item)
-            
-            # Dodanie etykiety kontynentu (opcjonalnie)
-            if self.show_labels and not is_antarctica:
+                continent_item.setParentItem(self._rotating_group)
+                
+                # Dodanie etykiety kontynentu (widoczna przy włączonych etykietach)
                 # Środek kontynentu
                 label_angle = continent_angle
                 label_radius = globe_radius * 0.7  # Nieco bliżej środka
@@ -357,7 +494,6 @@ class ObrotZiemi:
                 label_y = center_y + label_radius * math.sin(label_angle)
                 
                 # Utworzenie interaktywnego elementu etykiety
-                from widgets.koncentryczne_okregi import InteraktywnyElement
                 continent_label = InteraktywnyElement(
                     label_x - 30, label_y - 10, 60, 20,
                     continent["name"],
@@ -365,51 +501,61 @@ class ObrotZiemi:
                 )
                 
                 # Ukrycie tła elementu interaktywnego
-                continent_label.setPen(QPen(Qt.NoPen))
-                continent_label.setBrush(QBrush(Qt.NoBrush))
+                continent_label.setPen(self._no_pen)
+                continent_label.setBrush(self._no_brush)
                 
-                # Dodanie do sceny
+                # Dodanie do obracanej grupy
                 continent_label.setZValue(self.base_z_index + 10)
-                scene.addItem(continent_label)
+                continent_label.setParentItem(self._rotating_group)
+                self._continent_labels.append(continent_label)
     
-    def draw_geographic_grid(self, scene, center_x, center_y, inner_radius, outer_radius, num_meridians=12, num_parallels=6):
+    def draw_geographic_grid(self, center_x, center_y, inner_radius, outer_radius, num_meridians=12, num_parallels=6):
         """Rysowanie siatki geograficznej (południki i równoleżniki)"""
         # Średni promień kuli ziemskiej
         globe_radius = (inner_radius + outer_radius) / 2
         
-        # Rysowanie południków
-        for i in range(num_meridians):
-            meridian_angle = 2 * math.pi * i / num_meridians
+        # Transformacje południków i promienie równoleżników liczone tylko przy zmianie geometrii
+        key = (center_x, center_y, inner_radius, outer_radius, num_meridians, num_parallels)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            meridian_transforms = []
+            for i in range(num_meridians):
+                meridian_angle = 360 * i / num_meridians
+                
+                # Obrót linii południka wokół środka kuli
+                transform = QTransform()
+                transform.translate(center_x, center_y)
+                transform.rotate(meridian_angle)
+                transform.translate(-center_x, -center_y)
+                meridian_transforms.append(transform)
+            
+            parallel_radii = [globe_radius * i / num_parallels for i in range(1, num_parallels)]
             
+            # Przechowujemy tylko bieżącą geometrię - poprzednie rozmiary nie wracają przy zoomie
+            self._grid_cache.clear()
+            grid = self._grid_cache[key] = (meridian_transforms, parallel_radii)
+        
+        meridian_transforms, parallel_radii = grid
+        
+        # Rysowanie południków
+        for transform in meridian_transforms:
             # Rysowanie linii południka
             meridian = QGraphicsLineItem(
                 center_x, center_y - globe_radius,
                 center_x, center_y + globe_radius
             )
-            
-            # Obrót linii południka
-            from PyQt5.QtGui import QTransform
-            transform = QTransform()
-            transform.translate(center_x, center_y)
-            transform.rotate(math.degrees(meridian_angle))
-            transform.translate(-center_x, -center_y)
             meridian.setTransform(transform)
             
             # Ustawienie stylu południka
-            meridian_pen = QPen(QColor(100, 100, 150, 80))  # Półprzezroczysty
-            meridian_pen.setWidth(1)
-            meridian_pen.setStyle(Qt.DotLine)
-            meridian.setPen(meridian_pen)
+            meridian.setPen(self._meridian_pen)
             
-            # Dodanie do sceny
+            # Dodanie do warstwy statycznej
             meridian.setZValue(self.base_z_index + 2)  # Pod kontynentami
-            scene.addItem(meridian)
+            meridian.setParentItem(self._static_group)
+            self._grid_items.append(meridian)
         
         # Rysowanie równoleżników
-        for i in range(1, num_parallels):
-            # Obliczenie promienia równoleżnika
-            parallel_radius = globe_radius * i / num_parallels
-            
+        for parallel_radius in parallel_radii:
             # Rysowanie okręgu równoleżnika
             parallel = QGraphicsEllipseItem(
                 center_x - parallel_radius, center_y - parallel_radius,
@@ -417,41 +563,26 @@ class ObrotZiemi:
             )
             
             # Ustawienie stylu równoleżnika
-            parallel_pen = QPen(QColor(100, 100, 150, 80))  # Półprzezroczysty
-            parallel_pen.setWidth(1)
-            parallel_pen.setStyle(Qt.DotLine)
-            parallel.setPen(parallel_pen)
-            parallel.setBrush(QBrush(Qt.NoBrush))  # Bez wypełnienia
+            parallel.setPen(self._parallel_pen)
+            parallel.setBrush(self._no_brush)  # Bez wypełnienia
             
-            # Dodanie do sceny
+            # Dodanie do warstwy statycznej
             parallel.setZValue(self.base_z_index + 2)  # Pod kontynentami
-            scene.addItem(parallel)
+            parallel.setParentItem(self._static_group)
+            self._grid_items.append(parallel)
     
-    def draw_cities(self, scene, center_x, center_y, inner_radius, outer_radius, earth_rotation):
-        """Rysowanie miast"""
+    def draw_cities(self, center_x, center_y, inner_radius, outer_radius):
+        """Rysowanie miast w układzie długości geograficznej (obrót nadaje grupa)"""
         # Średni promień kuli ziemskiej
         globe_radius = (inner_radius + outer_radius) / 2
         
-        # Kąt obrotu Ziemi w radianach (konwersja ze stopni)
-        rotation_angle = math.radians(earth_rotation["rotation_angle"])
+        # Obliczenie pozycji miast na kuli ziemskiej
+        # Uwzględniamy szerokość geograficzną - miasta na równiku są najdalej od środka
+        # (cos szerokości: 1 dla równika, 0 dla biegunów)
+        city_xs, city_ys = _project(self._city_lon, self._city_lat_cos, 0.0, center_x, center_y, globe_radius)
         
         # Rysowanie każdego miasta
-        for city in self.cities:
-            # Kąt miasta (uwzględniając obrót Ziemi)
-            city_longitude_angle = math.radians(city["longitude"]) - rotation_angle
-            
-            # Kąt szerokości geograficznej (od równika)
-            city_latitude_angle = math.radians(city["latitude"])
-            
-            # Obliczenie pozycji miasta na kuli ziemskiej
-            # Uwzględniamy szerokość geograficzną - miasta na równiku są najdalej od środka
-            latitude_factor = math.cos(city_latitude_angle)  # 1 dla równika, 0 dla biegunów
-            city_radius = globe_radius * latitude_factor
-            
-            # Współrzędne miasta
-            city_x = center_x + city_radius * math.cos(city_longitude_angle)
-            city_y = center_y + city_radius * math.sin(city_longitude_angle)
-            
+        for city, city_x, city_y in zip(self.cities, city_xs.tolist(), city_ys.tolist()):
             # Rysowanie punktu miasta
             city_size = 4
             city_point = QGraphicsEllipseItem(
@@ -460,16 +591,15 @@ class ObrotZiemi:
             )
             
             # Ustawienie stylu punktu miasta
-            city_point.setPen(QPen(Qt.NoPen))
-            city_point.setBrush(QBrush(QColor(255, 200, 0)))  # Żółty punkt
+            city_point.setPen(self._no_pen)
+            city_point.setBrush(self._city_brush)
             
-            # Dodanie do sceny
+            # Dodanie do obracanej grupy
             city_point.setZValue(self.base_z_index + 15)  # Nad wszystkim
-            scene.addItem(city_point)
+            city_point.setParentItem(self._rotating_group)
             
             # Dodanie etykiety miasta
             # Utworzenie interaktywnego elementu etykiety
-            from widgets.koncentryczne_okregi import InteraktywnyElement
             city_label = InteraktywnyElement(
                 city_x - 25, city_y - 10, 50, 20,
                 city["name"],
@@ -479,14 +609,17 @@ class ObrotZiemi:
             )
             
             # Ukrycie tła elementu interaktywnego
-            city_label.setPen(QPen(Qt.NoPen))
-            city_label.setBrush(QBrush(Qt.NoBrush))
+            city_label.setPen(self._no_pen)
+            city_label.setBrush(self._no_brush)
             
-            # Dodanie do sceny
+            # Dodanie do obracanej grupy
             city_label.setZValue(self.base_z_index + 16)
-            scene.addItem(city_label)
+            city_label.setParentItem(self._rotating_group)
+            
+            self._city_items.append(city_point)
+            self._city_items.append(city_label)
     
-    def draw_time_info(self, scene, center_x, center_y, inner_radius, outer_radius, earth_rotation):
+    def draw_time_info(self, scene, group, center_x, center_y, inner_radius, outer_radius, earth_rotation):
         """Rysowanie informacji o aktualnym czasie"""
         # Określenie położenia panelu informacyjnego
         info_x = center_x - inner_radius * 0.9
@@ -494,14 +627,19 @@ class ObrotZiemi:
         info_width = inner_radius * 1.8
         info_height = inner_radius * 0.3
         
-        # Formatowanie czasu
-        time_str = earth_rotation["date"].strftime("%H:%M:%S")
-        
-        # Tekst informacyjny
-        info_text = f"Czas lokalny: {time_str}\nKąt obrotu: {earth_rotation['rotation_angle']:.1f}°\nNachylenie osi: {earth_rotation['tilt_angle']:.1f}°"
+        # Tekst informacyjny formatowany tylko wtedy, gdy zmieniła się wyświetlana wartość
+        now = earth_rotation["date"]
+        info_key = (now.hour, now.minute, now.second,
+                    round(earth_rotation["rotation_angle"], 1), round(earth_rotation["tilt_angle"], 1))
+        if info_key == self._info_cache[0]:
+            info_text = self._info_cache[1]
+        else:
+            # Formatowanie czasu
+            time_str = now.strftime("%H:%M:%S")
+            info_text = f"Czas lokalny: {time_str}\nKąt obrotu: {earth_rotation['rotation_angle']:.1f}°\nNachylenie osi: {earth_rotation['tilt_angle']:.1f}°"
+            self._info_cache = (info_key, info_text)
         
         # Utworzenie interaktywnego elementu informacyjnego
-        from widgets.koncentryczne_okregi import InteraktywnyElement
         info_element = InteraktywnyElement(
             info_x, info_y, info_width, info_height,
             "Informacje o obrocie Ziemi",
@@ -509,25 +647,31 @@ class ObrotZiemi:
         )
         
         # Ustawienie stylu elementu
-        info_element.setPen(QPen(QColor(150, 150, 200), 1))
-        info_element.setBrush(QBrush(Qt.NoBrush))  # Bez wypełnienia
+        info_element.setPen(self._info_pen)
+        info_element.setBrush(self._no_brush)  # Bez wypełnienia
         
-        # Dodanie do sceny
+        # Dodanie do grupy klatki
         info_element.setZValue(self.base_z_index + 30)
-        scene.addItem(info_element)
+        info_element.setParentItem(group)
         
-        # Dodanie tekstu bezpośrednio
-        time_display = QGraphicsTextItem(info_text)
-        time_display.setPos(info_x + 10, info_y + 10)
-        time_display.setDefaultTextColor(QColor(200, 200, 220))
-        
-        # Ustawienie czcionki
-        time_font = QFont("Arial", 8)
-        time_display.setFont(time_font)
-        
-        # Dodanie do sceny
-        time_display.setZValue(self.base_z_index + 31)
-        scene.addItem(time_display)
+        # Dodanie tekstu bezpośrednio - element tworzony tylko przy pierwszym rysowaniu
+        if self._time_display is None or self._time_display.scene() is not scene:
+            self._time_display = QGraphicsTextItem(info_text)
+            self._time_display.setDefaultTextColor(self._time_color)
+            
+            # Ustawienie czcionki
+            self._time_display.setFont(self._time_font)
+            
+            # Dodanie do sceny
+            self._time_display.setZValue(self.base_z_index + 31)
+            self.add_persistent_item(scene, self._time_display)
+        elif self._time_display_text != info_text:
+            # Ponowny układ tekstu tylko po zmianie treści
+            self._time_display.setPlainText(info_text)
+        self._time_display_text = info_text
+        
+        self._time_display.setPos(info_x + 10, info_y + 10)
+        self._time_display.setVisible(True)
     
     def cleanup(self):
         """Czyszczenie zasobów"""
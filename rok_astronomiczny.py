@@ -6,12 +6,93 @@ Moduł odpowiedzialny za wizualizację roku astronomicznego
 Prezentuje orbitę Ziemi, fazy księżyca, pory roku i znaki zodiaku
 """
 
-import math
+import bisect
 import datetime
-import calendar
-from PyQt5.QtWidgets import QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsPathItem
-from PyQt5.QtCore import Qt, QPointF, QRectF
-from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QRadialGradient
+import numpy as np
+from PyQt5.QtWidgets import QGraphicsEllipseItem, QGraphicsSimpleTextItem, QGraphicsPathItem
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QFontMetricsF, QPainterPath, QTransform
+
+# Moduł widgetu definiuje GrupaElementow przed importem systemów czasowych,
+# dzięki czemu ten import na poziomie modułu nie tworzy problemu z importem cyklicznym
+from widgets.koncentryczne_okregi import GrupaElementow, PERSISTENT_ITEM_KEY
+
+# Nazwy miesięcy
+_MONTH_NAMES = (
+    "Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec",
+    "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień"
+)
+
+
+def _unit_circle_xy(angles_deg):
+    """Punkty okręgu jednostkowego dla podanych kątów w stopniach - tablica (N, 2) kolumn x i y"""
+    angles = np.radians(angles_deg)
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+# Kierunki stałych punktów tarczy liczone raz przy imporcie modułu - współrzędne wszystkich
+# punktów dla danego promienia i środka liczone jednym wyrażeniem (xy * promień + środek)
+# Miesiące - co 30 stopni, od początku stycznia
+_MONTH_XY = _unit_circle_xy(np.arange(12) * 30.0)
+
+# Równonoce i przesilenia - co 90 stopni, od przesilenia zimowego
+_SOLSTICE_XY = _unit_circle_xy(np.arange(4) * 90.0)
+
+# Środki segmentów znaków zodiaku - segment zajmuje 30 stopni
+_ZODIAC_MID_XY = _unit_circle_xy(np.arange(12) * 30.0 + 15.0)
+
+# Współczynniki wielomianów średnich momentów równonocy i przesileń (J. Meeus, "Astronomical Algorithms",
+# tabela 27.B, lata 1000-3000): marzec, czerwiec, wrzesień, grudzień
+_MEEUS_COEFFICIENTS = (
+    (2451623.80984, 365242.37404, 0.05169, -0.00411, -0.00057),
+    (2451716.56767, 365241.62603, 0.00325, 0.00888, -0.00030),
+    (2451810.21715, 365242.01767, -0.11575, 0.00337, 0.00078),
+    (2451900.05952, 365242.74049, -0.06223, -0.00823, 0.00032)
+)
+
+# Dzień juliański epoki J2000.0 (1 stycznia 2000, godz. 12:00)
+_J2000_JD = 2451545.0
+_J2000 = datetime.datetime(2000, 1, 1, 12)
+
+
+def _meeus_equinox(year, season_idx):
+    """Dzień juliański (JDE) równonocy lub przesilenia - season_idx: 0 marzec, 1 czerwiec, 2 wrzesień, 3 grudzień"""
+    y = (year - 2000) / 1000
+    c0, c1, c2, c3, c4 = _MEEUS_COEFFICIENTS[season_idx]
+    return c0 + y * (c1 + y * (c2 + y * (c3 + y * c4)))
+
+
+def _jd_to_datetime(jd):
+    """Konwersja dnia juliańskiego na datę kalendarza gregoriańskiego"""
+    return _J2000 + datetime.timedelta(days=jd - _J2000_JD)
+
+
+# Znaki zodiaku z datami (przybliżone, w rzeczywistości zmieniają się co roku)
+# Wspólne dla wszystkich instancji - nie należy ich modyfikować
+ZODIAC_SIGNS = (
+    {"name": "Baran", "start_date": (3, 21), "end_date": (4, 19), "color": QColor(255, 0, 0, 100)},
+    {"name": "Byk", "start_date": (4, 20), "end_date": (5, 20), "color": QColor(0, 255, 0, 100)},
+    {"name": "Bliźnięta", "start_date": (5, 21), "end_date": (6, 20), "color": QColor(255, 255, 0, 100)},
+    {"name": "Rak", "start_date": (6, 21), "end_date": (7, 22), "color": QColor(0, 0, 255, 100)},
+    {"name": "Lew", "start_date": (7, 23), "end_date": (8, 22), "color": QColor(255, 0, 255, 100)},
+    {"name": "Panna", "start_date": (8, 23), "end_date": (9, 22), "color": QColor(0, 255, 255, 100)},
+    {"name": "Waga", "start_date": (9, 23), "end_date": (10, 22), "color": QColor(128, 0, 128, 100)},
+    {"name": "Skorpion", "start_date": (10, 23), "end_date": (11, 21), "color": QColor(128, 0, 0, 100)},
+    {"name": "Strzelec", "start_date": (11, 22), "end_date": (12, 21), "color": QColor(0, 128, 0, 100)},
+    {"name": "Koziorożec", "start_date": (12, 22), "end_date": (1, 19), "color": QColor(0, 0, 128, 100)},
+    {"name": "Wodnik", "start_date": (1, 20), "end_date": (2, 18), "color": QColor(128, 128, 0, 100)},
+    {"name": "Ryby", "start_date": (2, 19), "end_date": (3, 20), "color": QColor(0, 128, 128, 100)}
+)
+
+# Pory roku - indeks "equinox" wskazuje równonoc lub przesilenie rozpoczynające porę roku (patrz _meeus_equinox);
+# data początku zależy od roku i jest dopisywana w instancji
+SEASONS = (
+    {"name": "Wiosna", "equinox": 0, "color": QColor(124, 252, 0, 150)},
+    {"name": "Lato", "equinox": 1, "color": QColor(255, 165, 0, 150)},
+    {"name": "Jesień", "equinox": 2, "color": QColor(165, 42, 42, 150)},
+    {"name": "Zima", "equinox": 3, "color": QColor(135, 206, 250, 150)}
+)
+
 
 class RokAstronomiczny:
     """
@@ -28,106 +109,186 @@ class RokAstronomiczny:
         self.show_details = False
         self.style = "Klasyczny"
         
-        # Inicjalizacja dat równonocy i przesileń (przybliżone wartości)
-        # W rzeczywistości należałoby je obliczać w zależności od roku
-        self.vernal_equinox = datetime.datetime(datetime.datetime.now().year, 3, 20)  # Równonoc wiosenna (ok. 20 marca)
-        self.summer_solstice = datetime.datetime(datetime.datetime.now().year, 6, 21)  # Przesilenie letnie (ok. 21 czerwca)
-        self.autumn_equinox = datetime.datetime(datetime.datetime.now().year, 9, 23)  # Równonoc jesienna (ok. 23 września)
-        self.winter_solstice = datetime.datetime(datetime.datetime.now().year, 12, 21)  # Przesilenie zimowe (ok. 21 grudnia)
-        
-        # Znaki zodiaku z datami (przybliżone, w rzeczywistości zmieniają się co roku)
-        self.zodiac_signs = [
-            {"name": "Baran", "start_date": (3, 21), "end_date": (4, 19), "color": QColor(255, 0, 0, 100)},
-            {"name": "Byk", "start_date": (4, 20), "end_date": (5, 20), "color": QColor(0, 255, 0, 100)},
-            {"name": "Bliźnięta", "start_date": (5, 21), "end_date": (6, 20), "color": QColor(255, 255, 0, 100)},
-            {"name": "Rak", "start_date": (6, 21), "end_date": (7, 22), "color": QColor(0, 0, 255, 100)},
-            {"name": "Lew", "start_date": (7, 23), "end_date": (8, 22), "color": QColor(255, 0, 255, 100)},
-            {"name": "Panna", "start_date": (8, 23), "end_date": (9, 22), "color": QColor(0, 255, 255, 100)},
-            {"name": "Waga", "start_date": (9, 23), "end_date": (10, 22), "color": QColor(128, 0, 128, 100)},
-            {"name": "Skorpion", "start_date": (10, 23), "end_date": (11, 21), "color": QColor(128, 0, 0, 100)},
-            {"name": "Strzelec", "start_date": (11, 22), "end_date": (12, 21), "color": QColor(0, 128, 0, 100)},
-            {"name": "Koziorożec", "start_date": (12, 22), "end_date": (1, 19), "color": QColor(0, 0, 128, 100)},
-            {"name": "Wodnik", "start_date": (1, 20), "end_date": (2, 18), "color": QColor(128, 128, 0, 100)},
-            {"name": "Ryby", "start_date": (2, 19), "end_date": (3, 20), "color": QColor(0, 128, 128, 100)}
-        ]
+        # Półkula, dla której wyznaczana jest pora roku ("N" - północna, "S" - południowa)
+        self.hemisphere = "N"
+        
+        # Rok, dla którego wyznaczane są daty równonocy i przesileń
+        self._year = datetime.datetime.now().year
+        
+        # Numery porządkowe (toordinal) pierwszego i ostatniego dnia roku - dzień roku liczony odejmowaniem liczb całkowitych
+        self._year_start_ord = datetime.date(self._year, 1, 1).toordinal()
+        self._year_end_ord = datetime.date(self._year, 12, 31).toordinal()
+        
+        # Momenty równonocy i przesileń w danym roku jako dni juliańskie (wielomian Meeusa)
+        self._equinox_jd = [_meeus_equinox(self._year, i) for i in range(4)]
+        
+        # Daty równonocy i przesileń
+        self.vernal_equinox = _jd_to_datetime(self._equinox_jd[0])  # Równonoc wiosenna (ok. 20 marca)
+        self.summer_solstice = _jd_to_datetime(self._equinox_jd[1])  # Przesilenie letnie (ok. 21 czerwca)
+        self.autumn_equinox = _jd_to_datetime(self._equinox_jd[2])  # Równonoc jesienna (ok. 23 września)
+        self.winter_solstice = _jd_to_datetime(self._equinox_jd[3])  # Przesilenie zimowe (ok. 21 grudnia)
         
-        # Pory roku
+        # Znaki zodiaku - wspólne dane modułu
+        self.zodiac_signs = ZODIAC_SIGNS
+        
+        # Pory roku - stałe dane modułu uzupełnione o datę początku w bieżącym roku
+        equinox_dates = (self.vernal_equinox, self.summer_solstice, self.autumn_equinox, self.winter_solstice)
         self.seasons = [
-            {"name": "Wiosna", "start_date": self.vernal_equinox, "color": QColor(124, 252, 0, 150)},
-            {"name": "Lato", "start_date": self.summer_solstice, "color": QColor(255, 165, 0, 150)},
-            {"name": "Jesień", "start_date": self.autumn_equinox, "color": QColor(165, 42, 42, 150)},
-            {"name": "Zima", "start_date": self.winter_solstice, "color": QColor(135, 206, 250, 150)}
+            dict(season, start_date=equinox_dates[season["equinox"]]) for season in SEASONS
         ]
+        
+        # Dzień roku początku każdej pory roku - porównania dni jako liczb całkowitych zamiast obiektów datetime
+        for season in self.seasons:
+            season["start_ord"] = season["start_date"].toordinal()
+            season["start_doy"] = season["start_ord"] - self._year_start_ord + 1
+        
+        # Tablice indeksowane dniem roku: numer pory roku i znaku zodiaku dla każdego dnia
+        self.init_lookup_tables()
+        
+        # Pióra, pędzle i czcionki tworzone raz zamiast przy każdym rysowaniu
+        self.init_styles()
+        
+        # Pozycja w roku zmienia się raz na dobę - zapamiętana dla numeru porządkowego dnia
+        self._position_cache = (None, None)
+        
+        # Promienie pochodne (orbita, zodiak, etykiety) liczone raz dla danej geometrii pierścienia
+        self._geom_cache = {}
+        
+        # Funkcja rysowania wyspecjalizowana dla bieżącej geometrii i opcji wyświetlania
+        self._spec_cache = {}
+        
+        # Ścieżka segmentów zodiaku zależy tylko od geometrii pierścienia
+        self._zodiac_path_cache = {}
+        
+        # Trwała warstwa statyczna (tło, Słońce, orbita, podziałki, zodiak) - budowana od nowa
+        # tylko po zmianie geometrii lub opcji wyświetlania; w kolejnych klatkach przesuwana jest tylko Ziemia
+        self._static_key = None
+        self._static_group = None
+        self._earth_item = None
+    
+    def init_styles(self):
+        """Inicjalizacja piór, pędzli i czcionek używanych przy rysowaniu"""
+        # Obiekty są współdzielone przez wszystkie elementy sceny - nie należy ich modyfikować
+        self._no_pen = QPen(Qt.NoPen)
+        self._no_brush = QBrush(Qt.NoBrush)
+        self._white_pen = QPen(QColor(255, 255, 255), 1)
+        
+        self._inner_circle_pen = QPen(QColor(50, 50, 80), 1)
+        self._sun_pen = QPen(QColor(255, 140, 0, 150), 1)
+        self._orbit_pen = QPen(QColor(100, 100, 150), 1, Qt.DashLine)
+        self._earth_pen = QPen(QColor(255, 255, 255, 150), 1)
+        
+        # Znaczniki i etykiety miesięcy
+        self._marker_brush = QBrush(QColor(200, 200, 255))
+        self._label_brush = QBrush(QColor(200, 200, 255))
+        self._white_brush = QBrush(QColor(255, 255, 255))
+        
+        self._font_small = QFont("Arial", 6)
+        self._font_small_bold = QFont("Arial", 6)
+        self._font_small_bold.setBold(True)
+        self._info_font = QFont("Arial", 8)
+        
+        # Punkty równonocy i przesileń w kolejności od przesilenia zimowego (co 90 stopni)
+        self._solstice_points = [
+            {"name": "Przesilenie zimowe", "color": QColor(135, 206, 250)},  # 0 stopni, jasny niebieski
+            {"name": "Równonoc wiosenna", "color": QColor(124, 252, 0)},     # 90 stopni, jasny zielony
+            {"name": "Przesilenie letnie", "color": QColor(255, 165, 0)},    # 180 stopni, pomarańczowy
+            {"name": "Równonoc jesienna", "color": QColor(165, 42, 42)}      # 270 stopni, brązowy
+        ]
+        for point in self._solstice_points:
+            point["brush"] = QBrush(point["color"])
+        
+        # Rozmiary etykiet liczone raz z metryki czcionki zamiast układania tekstu przy każdym rysowaniu
+        small_metrics = QFontMetricsF(self._font_small)
+        bold_metrics = QFontMetricsF(self._font_small_bold)
+        self._label_sizes = {}
+        for name in _MONTH_NAMES + tuple(sign["name"] for sign in self.zodiac_signs):
+            self._label_sizes[name] = (small_metrics.horizontalAdvance(name), small_metrics.height())
+        for point in self._solstice_points:
+            self._label_sizes[point["name"]] = (bold_metrics.horizontalAdvance(point["name"]), bold_metrics.height())
+        
+        # Szerokości wierszy informacji o porze roku i znaku zodiaku
+        info_metrics = QFontMetricsF(self._info_font)
+        info_lines = ([f"Pora roku: {season['name']}" for season in self.seasons] +
+                      [f"Znak zodiaku: {sign['name']}" for sign in self.zodiac_signs])
+        self._info_line_widths = {line: info_metrics.horizontalAdvance(line) for line in info_lines}
+    
+    def init_lookup_tables(self):
+        """Zbudowanie tablic pory roku i znaku zodiaku dla każdego dnia roku (indeks 1-366)"""
+        # Posortowane dni roku początków znaków zodiaku i odpowiadające im indeksy znaków
+        # Koziorożec zaczyna się najpóźniej, więc dni sprzed pierwszej granicy (początek stycznia)
+        # trafiają na ostatnią pozycję - przejście roku nie wymaga osobnego przypadku
+        zodiac_starts = sorted(
+            (datetime.date(self._year, *sign["start_date"]).timetuple().tm_yday, i)
+            for i, sign in enumerate(self.zodiac_signs)
+        )
+        self._zodiac_boundaries = [start_doy for start_doy, _ in zodiac_starts]
+        self._zodiac_order = [i for _, i in zodiac_starts]
+        
+        self._season_by_doy_north = np.zeros(367, dtype=np.int8)
+        self._zodiac_by_doy = np.zeros(367, dtype=np.int8)
+        for day_of_year in range(1, 367):
+            # Pora roku - ostatnia, która już się zaczęła; przed równonocą wiosenną trwa jeszcze zima
+            season_idx = len(self.seasons) - 1
+            for i, season in enumerate(self.seasons):
+                if day_of_year >= season["start_doy"]:
+                    season_idx = i
+            self._season_by_doy_north[day_of_year] = season_idx
+            
+            # Znak zodiaku - ostatnia granica nie większa od dnia roku (indeks -1 to Koziorożec z grudnia)
+            zodiac_pos = bisect.bisect_right(self._zodiac_boundaries, day_of_year) - 1
+            self._zodiac_by_doy[day_of_year] = self._zodiac_order[zodiac_pos]
+        
+        # Na półkuli południowej pory roku są przesunięte o pół roku (dwie pory)
+        self._season_by_doy_south = (self._season_by_doy_north + 2) % len(self.seasons)
+        
+        # Tablica aktywnej półkuli - wybór półkuli nie dodaje warunków przy odczycie pozycji
+        self._season_by_doy = self._season_by_doy_south if self.hemisphere == "S" else self._season_by_doy_north
     
     def get_current_position(self):
         """Obliczenie aktualnej pozycji w roku astronomicznym"""
         now = datetime.datetime.now()
         
-        # Dzień roku (1-366)
-        day_of_year = now.timetuple().tm_yday
+        # Przez całą dobę pozycja jest taka sama - zwracamy zapamiętany wynik
+        now_ord = now.toordinal()
+        if now_ord == self._position_cache[0]:
+            return self._position_cache[1]
+        
+        # Dzień roku (1-366) - z numeru porządkowego daty, bez budowania struktury time.struct_time
+        if self._year_start_ord <= now_ord <= self._year_end_ord:
+            day_of_year = now_ord - self._year_start_ord + 1
+        else:
+            # Inny rok niż ten, dla którego zbudowano tablice
+            day_of_year = now.timetuple().tm_yday
         
         # Konwersja na kąt (0-360 stopni)
         # Zakładamy, że rok zaczyna się w punkcie orbity odpowiadającym przesileniu zimowemu (ziemia jest najbliżej Słońca)
-        angle = (day_of_year / 365.25) * 360
+        angle = day_of_year * (360.0 / 365.25)
         
-        # Obliczenie aktualnej pory roku
-        current_season = None
-        for i, season in enumerate(self.seasons):
-            next_i = (i + 1) % len(self.seasons)
-            next_season = self.seasons[next_i]
-            
-            # Sprawdzenie czy aktualna data jest pomiędzy początkiem bieżącej pory roku a początkiem następnej
-            # (z uwzględnieniem przejścia roku)
-            if i == len(self.seasons) - 1:  # Zima
-                if now >= season["start_date"] or now < next_season["start_date"]:
-                    current_season = season
-                    break
-            else:
-                if season["start_date"] <= now < next_season["start_date"]:
-                    current_season = season
-                    break
-        
-        # Jeśli nie udało się określić pory roku, przyjmujemy zimę
-        if not current_season:
-            current_season = self.seasons[3]  # Zima
-        
-        # Obliczenie aktualnego znaku zodiaku
-        current_zodiac = None
-        for sign in self.zodiac_signs:
-            start_month, start_day = sign["start_date"]
-            end_month, end_day = sign["end_date"]
-            
-            # Sprawdzenie czy aktualna data mieści się w zakresie znaku
-            # (z uwzględnieniem przejścia roku dla Koziorożca)
-            if start_month > end_month:  # Przejście przez koniec roku (Koziorożec)
-                if (now.month == start_month and now.day >= start_day) or \
-                   (now.month == end_month and now.day <= end_day) or \
-                   (start_month < now.month <= 12) or \
-                   (1 <= now.month < end_month):
-                    current_zodiac = sign
-                    break
-            else:
-                if (now.month == start_month and now.day >= start_day) or \
-                   (now.month == end_month and now.day <= end_day) or \
-                   (start_month < now.month < end_month):
-                    current_zodiac = sign
-                    break
-        
-        # Jeśli nie udało się określić znaku zodiaku, przyjmujemy Barana
-        if not current_zodiac:
-            current_zodiac = self.zodiac_signs[0]  # Baran
-            
-        return {
+        # Pora roku i znak zodiaku odczytywane z tablic przygotowanych w init_lookup_tables
+        position = {
             "day_of_year": day_of_year,
             "angle": angle,
-            "current_season": current_season,
-            "current_zodiac": current_zodiac
+            "current_season": self.seasons[self._season_by_doy[day_of_year]],
+            "current_zodiac": self.zodiac_signs[self._zodiac_by_doy[day_of_year]]
         }
+        self._position_cache = (now_ord, position)
+        return position
     
     def set_timezone(self, timezone):
         """Ustawienie strefy czasowej"""
         self.timezone = timezone
     
+    def set_hemisphere(self, hemisphere):
+        """Ustawienie półkuli ("N" lub "S"), dla której wyznaczana jest pora roku"""
+        if hemisphere == self.hemisphere:
+            return
+        self.hemisphere = hemisphere
+        self._season_by_doy = self._season_by_doy_south if hemisphere == "S" else self._season_by_doy_north
+        
+        # Zapamiętana pozycja zawiera porę roku poprzedniej półkuli
+        self._position_cache = (None, None)
+    
     def set_display_options(self, show_labels=True, show_details=False, style="Klasyczny"):
         """Ustawienie opcji wyświetlania"""
         self.show_labels = show_labels
@@ -136,77 +297,164 @@ class RokAstronomiczny:
     
     def draw(self, scene, inner_radius, outer_radius):
         """Rysowanie wizualizacji roku astronomicznego"""
+        # Funkcja rysowania przygotowana dla bieżących promieni i opcji - budowana tylko po ich zmianie
+        opts = (self.show_labels, self.show_details, self.style)
+        key = (inner_radius, outer_radius, opts)
+        draw_specialized = self._spec_cache.get(key)
+        if draw_specialized is None:
+            draw_specialized = self._build_specialized_draw(inner_radius, outer_radius, opts)
+            
+            # Przechowujemy tylko bieżącą wersję - poprzednie rozmiary nie wracają przy zoomie
+            self._spec_cache.clear()
+            self._spec_cache[key] = draw_specialized
+        
+        # Pobranie aktualnej pozycji astronomicznej i rysowanie
+        draw_specialized(scene, self.get_current_position())
+    
+    def _build_specialized_draw(self, inner_radius, outer_radius, opts):
+        """Zbudowanie funkcji rysowania ze stałymi wyliczonymi z góry dla danych promieni i opcji"""
         # Obliczenie środka sceny
         center_x = 0
         center_y = 0
         
-        # Pobranie aktualnej pozycji astronomicznej
-        position = self.get_current_position()
-        
-        # Rysowanie tła (ciemny kosmos)
-        self.draw_background(scene, center_x, center_y, inner_radius, outer_radius)
-        
-        # Rysowanie Słońca w środku
-        self.draw_sun(scene, center_x, center_y, inner_radius)
-        
-        # Rysowanie orbity Ziemi
-        self.draw_earth_orbit(scene, center_x, center_y, inner_radius, outer_radius)
+        # Promienie wszystkich elementów dla danej geometrii pierścienia
+        geom = self._compute_geom(inner_radius, outer_radius)
         
-        # Rysowanie podziałki roku (miesiące)
-        if self.show_labels:
-            self.draw_month_markers(scene, center_x, center_y, inner_radius, outer_radius)
+        # Punkt początku orbity - w każdej klatce obracany o kąt pozycji Ziemi
+        orbit_point = QPointF(geom["orbit_radius"], 0)
         
-        # Rysowanie oznaczeń pór roku
-        self.draw_seasons(scene, center_x, center_y, inner_radius, outer_radius)
+        show_details = opts[1]
         
-        # Rysowanie znaków zodiaku
-        if self.show_details:
-            self.draw_zodiac(scene, center_x, center_y, inner_radius, outer_radius)
+        def draw_specialized(scene, position):
+            # Rysowanie trwałej warstwy statycznej (odbudowywana tylko dla nowej sceny lub geometrii)
+            self.draw_static_layer(scene, center_x, center_y, geom)
+            
+            # Rysowanie aktualnej pozycji Ziemi na orbicie - obrót punktu początku orbity o kąt pozycji (w stopniach)
+            earth_point = QTransform().rotate(position["angle"]).map(orbit_point)
+            
+            # Przesunięcie trwałego elementu Ziemi (zbudowanego w draw_static_layer)
+            self._earth_item.setPos(center_x + earth_point.x(), center_y + earth_point.y())
+            
+            # Rysowanie informacji o aktualnej porze roku i znaku zodiaku
+            if show_details:
+                self.draw_current_info(scene, center_x, center_y, geom, position)
         
-        # Rysowanie aktualnej pozycji Ziemi na orbicie
-        self.draw_earth_position(scene, center_x, center_y, inner_radius, outer_radius, position)
+        return draw_specialized
+    
+    def _compute_geom(self, inner_radius, outer_radius):
+        """Promienie elementów wizualizacji wyznaczane z promieni pierścienia (zapamiętane dla danej pary)"""
+        key = (inner_radius, outer_radius)
+        geom = self._geom_cache.get(key)
+        if geom is None:
+            # Średni promień pierścienia - to będzie promień orbity
+            orbit_radius = (inner_radius + outer_radius) / 2
+            
+            # Różnica między promieniami
+            radius_diff = outer_radius - inner_radius
+            
+            # Zewnętrzny promień i szerokość pierścienia zodiaku
+            zodiac_radius = outer_radius - radius_diff * 0.1
+            zodiac_width = radius_diff * 0.2
+            
+            geom = {
+                "inner_radius": inner_radius,
+                "outer_radius": outer_radius,
+                "orbit_radius": orbit_radius,
+                "sun_radius": inner_radius * 0.7,  # Mniejszy niż wewnętrzny promień pierścienia
+                "earth_radius": radius_diff * 0.15,
+                "month_label_radius": orbit_radius * 1.1,  # Nieco dalej od znaczników
+                "solstice_label_radius": orbit_radius * 0.85,  # Nieco bliżej środka
+                "zodiac_radius": zodiac_radius,
+                "inner_zodiac_radius": zodiac_radius - zodiac_width,
+                "zodiac_label_radius": zodiac_radius - zodiac_width / 2,
+                # Informacje u dołu pierścienia - z marginesem 4 px, który miało wcześniejsze pole QGraphicsTextItem
+                "info_offset": outer_radius * 0.8 + 4
+            }
+            
+            # Przechowujemy tylko bieżącą geometrię - poprzednie rozmiary nie wracają przy zoomie
+            self._geom_cache.clear()
+            self._geom_cache[key] = geom
+        return geom
+    
+    def add_persistent_item(self, scene, item):
+        """Dodanie do sceny elementu trwałego, który nie jest usuwany przy odświeżaniu widoku"""
+        item.setData(PERSISTENT_ITEM_KEY, True)
+        scene.addItem(item)
+    
+    def draw_static_layer(self, scene, center_x, center_y, geom):
+        """Rysowanie elementów statycznych - budowanych od nowa tylko po zmianie geometrii lub opcji"""
+        key = (center_x, center_y, geom["inner_radius"], geom["outer_radius"],
+               self.show_labels, self.show_details, self.style)
+        
+        if key != self._static_key or self._static_group.scene() is not scene:
+            # Usunięcie elementów zbudowanych dla poprzedniej geometrii (razem z grupą)
+            if self._static_group is not None and self._static_group.scene() is not None:
+                self._static_group.scene().removeItem(self._static_group)
+            
+            # Grupa nadrzędna wszystkich elementów trwałych - dodawana do sceny jednym wywołaniem
+            # Z-indeksy elementów podrzędnych są względne wobec grupy, więc cała grupa musi leżeć
+            # nad siatką pomocniczą (z = 10) i pod informacją o porze roku (z = 25)
+            self._static_group = GrupaElementow()
+            self._static_group.setZValue(11)
+            
+            # Rysowanie tła (ciemny kosmos)
+            self.draw_background(center_x, center_y, geom)
+            
+            # Rysowanie Słońca w środku
+            self.draw_sun(center_x, center_y, geom)
+            
+            # Rysowanie orbity Ziemi
+            self.draw_earth_orbit(center_x, center_y, geom)
+            
+            # Rysowanie podziałki roku (miesiące)
+            if self.show_labels:
+                self.draw_month_markers(center_x, center_y, geom)
+            
+            # Rysowanie oznaczeń pór roku
+            self.draw_seasons(center_x, center_y, geom)
+            
+            # Rysowanie znaków zodiaku
+            if self.show_details:
+                self.draw_zodiac(center_x, center_y, geom)
+            
+            # Ziemia - tworzona w środku układu współrzędnych, w każdej klatce tylko przesuwana
+            earth_radius = geom["earth_radius"]
+            self._earth_item = QGraphicsEllipseItem(
+                -earth_radius, -earth_radius,
+                earth_radius * 2, earth_radius * 2
+            )
+            self._earth_item.setBrush(self._no_brush)
+            self._earth_item.setPen(self._earth_pen)
+            self._earth_item.setZValue(20)  # Z-index dla Ziemi (wyższy niż wszystko inne)
+            self._earth_item.setParentItem(self._static_group)
+            
+            # Dodanie całej warstwy do sceny po zbudowaniu elementów podrzędnych
+            self.add_persistent_item(scene, self._static_group)
+            self._static_key = key
         
-        # Rysowanie informacji o aktualnej porze roku i znaku zodiaku
-        if self.show_details:
-            self.draw_current_info(scene, center_x, center_y, inner_radius, outer_radius, position)
+        # Elementy trwałe są ukrywane przy odświeżaniu sceny
+        self._static_group.setVisible(True)
     
-    def draw_background(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_background(self, center_x, center_y, geom):
         """Rysowanie tła - kosmicznej przestrzeni"""
-        # Promień zewnętrznego koła
-        radius = outer_radius
-        
-        # Rysowanie tła jako koła wypełnionego gradientem
-        background = QGraphicsEllipseItem(
-            center_x - radius, center_y - radius,
-            radius * 2, radius * 2
-        )
-        
-        # Brak wypełnienia tła - tylko kontur
-        background.setBrush(QBrush(Qt.NoBrush))
-        
-        # Brak obramowania
-        background.setPen(QPen(Qt.NoPen))
-        
-        # Dodanie do sceny
-        scene.addItem(background)
-        background.setZValue(10)  # Z-index dla tła
-        
+        # Samo tło jest przezroczyste (bez wypełnienia i obramowania), więc rysowany jest tylko wewnętrzny krąg
         # Dodanie wewnętrznego kręgu
+        inner_radius = geom["inner_radius"]
         inner_circle = QGraphicsEllipseItem(
             center_x - inner_radius, center_y - inner_radius,
             inner_radius * 2, inner_radius * 2
         )
-        inner_circle.setPen(QPen(QColor(50, 50, 80), 1))
-        inner_circle.setBrush(QBrush(Qt.NoBrush))
+        inner_circle.setPen(self._inner_circle_pen)
+        inner_circle.setBrush(self._no_brush)
         
-        # Dodanie do sceny
-        scene.addItem(inner_circle)
+        # Dodanie do warstwy statycznej
         inner_circle.setZValue(11)
+        inner_circle.setParentItem(self._static_group)
     
-    def draw_sun(self, scene, center_x, center_y, inner_radius):
+    def draw_sun(self, center_x, center_y, geom):
         """Rysowanie Słońca w środku układu"""
         # Promień Słońca (mniejszy niż wewnętrzny promień pierścienia)
-        sun_radius = inner_radius * 0.7
+        sun_radius = geom["sun_radius"]
         
         # Rysowanie Słońca jako koła z gradientem
         sun = QGraphicsEllipseItem(
@@ -214,23 +462,17 @@ class RokAstronomiczny:
             sun_radius * 2, sun_radius * 2
         )
         
-        # Gradient dla Słońca - od żółtego do pomarańczowego
-        gradient = QRadialGradient(center_x, center_y, sun_radius)
-        gradient.setColorAt(0, QColor(255, 255, 200))  # Jasny żółty w środku
-        gradient.setColorAt(0.7, QColor(255, 200, 50))  # Żółty
-        gradient.setColorAt(1, QColor(255, 140, 0))    # Pomarańczowy na krawędzi
-        
-        sun.setBrush(QBrush(Qt.NoBrush))
-        sun.setPen(QPen(QColor(255, 140, 0, 150), 1))
+        sun.setBrush(self._no_brush)
+        sun.setPen(self._sun_pen)
         
-        # Dodanie do sceny
-        scene.addItem(sun)
+        # Dodanie do warstwy statycznej
         sun.setZValue(15)  # Z-index dla Słońca (wyższy niż tło)
+        sun.setParentItem(self._static_group)
     
-    def draw_earth_orbit(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_earth_orbit(self, center_x, center_y, geom):
         """Rysowanie orbity Ziemi"""
-        # Średni promień pierścienia - to będzie promień orbity
-        orbit_radius = (inner_radius + outer_radius) / 2
+        # Promień orbity - średni promień pierścienia
+        orbit_radius = geom["orbit_radius"]
         
         # Rysowanie orbity jako okręgu
         orbit = QGraphicsEllipseItem(
@@ -239,251 +481,183 @@ class RokAstronomiczny:
         )
         
         # Ustawienie stylu orbity
-        orbit.setPen(QPen(QColor(100, 100, 150), 1, Qt.DashLine))
-        orbit.setBrush(QBrush(Qt.NoBrush))
+        orbit.setPen(self._orbit_pen)
+        orbit.setBrush(self._no_brush)
         
-        # Dodanie do sceny
-        scene.addItem(orbit)
+        # Dodanie do warstwy statycznej
         orbit.setZValue(12)  # Z-index dla orbity (nad tłem, pod Ziemią)
+        orbit.setParentItem(self._static_group)
     
-    def draw_month_markers(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_month_markers(self, center_x, center_y, geom):
         """Rysowanie znaczników miesięcy"""
         # Średni promień pierścienia
-        orbit_radius = (inner_radius + outer_radius) / 2
+        orbit_radius = geom["orbit_radius"]
         
-        # Nazwy miesięcy
-        month_names = [
-            "Styczeń", "Luty", "Marzec", "Kwiecień", "Maj", "Czerwiec",
-            "Lipiec", "Sierpień", "Wrzesień", "Październik", "Listopad", "Grudzień"
-        ]
+        # Pozycje znaczników i etykiet wszystkich miesięcy (0 stopni = początek stycznia, 30 stopni na miesiąc)
+        # Etykiety leżą nieco dalej od znaczników
+        label_radius = geom["month_label_radius"]
+        center = (center_x, center_y)
+        marker_points = (_MONTH_XY * orbit_radius + center).tolist()
+        label_points = (_MONTH_XY * label_radius + center).tolist()
+        
+        # Znaczniki wszystkich miesięcy zbierane w jednej ścieżce - jeden element sceny zamiast dwunastu
+        markers_path = QPainterPath()
         
         # Rysowanie znaczników dla każdego miesiąca
-        for i, month_name in enumerate(month_names):
-            # Kąt dla danego miesiąca (0 stopni = początek stycznia)
-            angle = math.radians(i * 30)  # 360 / 12 = 30 stopni na miesiąc
-            
-            # Obliczenie pozycji znacznika
-            marker_x = center_x + orbit_radius * math.cos(angle)
-            marker_y = center_y + orbit_radius * math.sin(angle)
-            
+        for i, month_name in enumerate(_MONTH_NAMES):
             # Rysowanie znacznika jako małego punktu
-            marker = QGraphicsEllipseItem(
-                marker_x - 2, marker_y - 2, 4, 4
-            )
-            marker.setBrush(QBrush(QColor(200, 200, 255)))
-            marker.setPen(QPen(Qt.NoPen))
-            
-            # Dodanie do sceny
-            scene.addItem(marker)
-            marker.setZValue(13)
+            marker_x, marker_y = marker_points[i]
+            markers_path.addEllipse(marker_x - 2, marker_y - 2, 4, 4)
             
             # Dodanie etykiety z nazwą miesiąca
             if self.show_labels:
-                # Pozycja etykiety (nieco dalej od znacznika)
-                label_radius = orbit_radius * 1.1
-                label_x = center_x + label_radius * math.cos(angle)
-                label_y = center_y + label_radius * math.sin(angle)
+                label_x, label_y = label_points[i]
                 
                 # Utworzenie etykiety
-                label = QGraphicsTextItem(month_name)
+                label = QGraphicsSimpleTextItem(month_name)
                 
                 # Ustawienie czcionki i koloru
-                font = QFont("Arial", 6)
-                label.setFont(font)
-                label.setDefaultTextColor(QColor(200, 200, 255))
+                label.setFont(self._font_small)
+                label.setBrush(self._label_brush)
                 
-                # Obliczenie szerokości tekstu dla właściwego wyśrodkowania
-                text_width = label.boundingRect().width()
-                text_height = label.boundingRect().height()
+                # Rozmiar tekstu dla właściwego wyśrodkowania
+                text_width, text_height = self._label_sizes[month_name]
                 
                 # Ustawienie pozycji z uwzględnieniem szerokości tekstu
                 label.setPos(label_x - text_width / 2, label_y - text_height / 2)
                 
-                # Dodanie do sceny
-                scene.addItem(label)
+                # Dodanie do warstwy statycznej
                 label.setZValue(13)
+                label.setParentItem(self._static_group)
+        
+        # Dodanie wszystkich znaczników jednym elementem
+        markers = QGraphicsPathItem(markers_path)
+        markers.setPen(self._no_pen)
+        markers.setBrush(self._marker_brush)
+        markers.setZValue(13)
+        markers.setParentItem(self._static_group)
     
-    def draw_seasons(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_seasons(self, center_x, center_y, geom):
         """Rysowanie oznaczeń pór roku"""
         # Średni promień pierścienia
-        orbit_radius = (inner_radius + outer_radius) / 2
+        orbit_radius = geom["orbit_radius"]
         
-        # Pozycje równonocy i przesileń (kąty w stopniach)
+        # Pozycje równonocy i przesileń co 90 stopni
         # Zakładamy, że rok zaczyna się od przesilenia zimowego (ok. 21 grudnia)
-        vernal_equinox_angle = math.radians(90)    # Równonoc wiosenna (ok. 20 marca)
-        summer_solstice_angle = math.radians(180)  # Przesilenie letnie (ok. 21 czerwca)
-        autumn_equinox_angle = math.radians(270)   # Równonoc jesienna (ok. 23 września)
-        winter_solstice_angle = math.radians(0)    # Przesilenie zimowe (ok. 21 grudnia)
+        # Etykiety leżą nieco bliżej środka niż znaczniki
+        label_radius = geom["solstice_label_radius"]
+        center = (center_x, center_y)
+        marker_points = (_SOLSTICE_XY * orbit_radius + center).tolist()
+        label_points = (_SOLSTICE_XY * label_radius + center).tolist()
         
         # Rysowanie znaczników dla punktów równonocy i przesileń
-        solstice_points = [
-            {"name": "Przesilenie zimowe", "angle": winter_solstice_angle, "color": QColor(135, 206, 250)},  # Jasny niebieski
-            {"name": "Równonoc wiosenna", "angle": vernal_equinox_angle, "color": QColor(124, 252, 0)},      # Jasny zielony
-            {"name": "Przesilenie letnie", "angle": summer_solstice_angle, "color": QColor(255, 165, 0)},    # Pomarańczowy
-            {"name": "Równonoc jesienna", "angle": autumn_equinox_angle, "color": QColor(165, 42, 42)}       # Brązowy
-        ]
-        
-        for point in solstice_points:
-            # Obliczenie pozycji znacznika
-            marker_x = center_x + orbit_radius * math.cos(point["angle"])
-            marker_y = center_y + orbit_radius * math.sin(point["angle"])
+        for i, point in enumerate(self._solstice_points):
+            marker_x, marker_y = marker_points[i]
             
             # Rysowanie znacznika jako wyraźniejszego punktu
             marker = QGraphicsEllipseItem(
                 marker_x - 3, marker_y - 3, 6, 6
             )
-            marker.setBrush(QBrush(point["color"]))
-            marker.setPen(QPen(QColor(255, 255, 255), 1))
+            marker.setBrush(point["brush"])
+            marker.setPen(self._white_pen)
             
-            # Dodanie do sceny
-            scene.addItem(marker)
+            # Dodanie do warstwy statycznej
             marker.setZValue(14)
+            marker.setParentItem(self._static_group)
             
             # Dodanie etykiety dla punktu
             if self.show_labels:
-                # Pozycja etykiety (nieco dalej od znacznika)
-                label_radius = orbit_radius * 0.85
-                label_x = center_x + label_radius * math.cos(point["angle"])
-                label_y = center_y + label_radius * math.sin(point["angle"])
+                label_x, label_y = label_points[i]
                 
                 # Utworzenie etykiety
-                label = QGraphicsTextItem(point["name"])
+                label = QGraphicsSimpleTextItem(point["name"])
                 
                 # Ustawienie czcionki i koloru
-                font = QFont("Arial", 6)
-                font.setBold(True)
-                label.setFont(font)
-                label.setDefaultTextColor(point["color"])
+                label.setFont(self._font_small_bold)
+                label.setBrush(point["brush"])
                 
-                # Obliczenie szerokości tekstu dla właściwego wyśrodkowania
-                text_width = label.boundingRect().width()
-                text_height = label.boundingRect().height()
+                # Rozmiar tekstu dla właściwego wyśrodkowania
+                text_width, text_height = self._label_sizes[point["name"]]
                 
                 # Ustawienie pozycji z uwzględnieniem szerokości tekstu
                 label.setPos(label_x - text_width / 2, label_y - text_height / 2)
                 
-                # Dodanie do sceny
-                scene.addItem(label)
+                # Dodanie do warstwy statycznej
                 label.setZValue(14)
+                label.setParentItem(self._static_group)
     
-    def draw_zodiac(self, scene, center_x, center_y, inner_radius, outer_radius):
+    def draw_zodiac(self, center_x, center_y, geom):
         """Rysowanie znaków zodiaku"""
         if not self.show_details:
             return
             
-        # Różnica między promieniami
-        radius_diff = outer_radius - inner_radius
-        
-        # Zewnętrzny promień dla segmentów zodiaku
-        zodiac_radius = outer_radius - radius_diff * 0.1
+        # Zewnętrzny i wewnętrzny promień segmentów zodiaku
+        zodiac_radius = geom["zodiac_radius"]
+        inner_zodiac_radius = geom["inner_zodiac_radius"]
+        
+        # Segmenty wszystkich znaków zbierane w jednej ścieżce (mają to samo pióro i pędzel)
+        # Ścieżka budowana tylko przy zmianie geometrii pierścienia
+        key = (center_x, center_y, zodiac_radius, inner_zodiac_radius)
+        segments_path = self._zodiac_path_cache.get(key)
+        if segments_path is None:
+            segments_path = QPainterPath()
+            for i in range(len(self.zodiac_signs)):
+                # Kąt początkowy i końcowy (każdy znak zajmuje 30 stopni)
+                start_angle = i * 30
+                span_angle = 30
+                
+                # Segment wypełniający tylko część pierścienia - osobna podścieżka wspólnej ścieżki
+                segments_path.arcMoveTo(center_x - zodiac_radius, center_y - zodiac_radius,
+                                        zodiac_radius * 2, zodiac_radius * 2, start_angle)
+                segments_path.arcTo(center_x - zodiac_radius, center_y - zodiac_radius,
+                                    zodiac_radius * 2, zodiac_radius * 2, start_angle, span_angle)
+                
+                # Dodanie wewnętrznego łuku
+                segments_path.arcTo(center_x - inner_zodiac_radius, center_y - inner_zodiac_radius,
+                                    inner_zodiac_radius * 2, inner_zodiac_radius * 2, 
+                                    start_angle + span_angle, -span_angle)
+                
+                segments_path.closeSubpath()
+            
+            # Przechowujemy tylko bieżącą geometrię - poprzednie rozmiary nie wracają przy zoomie
+            self._zodiac_path_cache.clear()
+            self._zodiac_path_cache[key] = segments_path
         
-        # Szerokość pierścienia zodiaku
-        zodiac_width = radius_diff * 0.2
+        # Pozycje etykiet na środkach segmentów wszystkich znaków
+        label_radius = geom["zodiac_label_radius"]
+        label_points = (_ZODIAC_MID_XY * label_radius + (center_x, center_y)).tolist()
         
-        # Rysowanie segmentów dla każdego znaku zodiaku
+        # Rysowanie etykiet dla każdego znaku zodiaku
         for i, sign in enumerate(self.zodiac_signs):
-            # Kąt początkowy i końcowy (każdy znak zajmuje 30 stopni)
-            start_angle = i * 30
-            span_angle = 30
-            
-            # Rysowanie segmentu dla znaku
-            zodiac_segment = QGraphicsEllipseItem(
-                center_x - zodiac_radius, center_y - zodiac_radius,
-                zodiac_radius * 2, zodiac_radius * 2
-            )
-            
-            # Ustawienie pióra i pędzla
-            segment_pen = QPen(Qt.NoPen)
-            zodiac_segment.setPen(segment_pen)
-            
-            # Tworzymy ścieżkę dla wypełnienia tylko części pierścienia
-            path = QPainterPath()
-            path.arcMoveTo(center_x - zodiac_radius, center_y - zodiac_radius,
-                         zodiac_radius * 2, zodiac_radius * 2, start_angle)
-            path.arcTo(center_x - zodiac_radius, center_y - zodiac_radius,
-                      zodiac_radius * 2, zodiac_radius * 2, start_angle, span_angle)
-            
-            # Dodanie wewnętrznego łuku
-            inner_zodiac_radius = zodiac_radius - zodiac_width
-            path.arcTo(center_x - inner_zodiac_radius, center_y - inner_zodiac_radius,
-                      inner_zodiac_radius * 2, inner_zodiac_radius * 2, 
-                      start_angle + span_angle, -span_angle)
-            
-            path.closeSubpath()
-            
-            # Utworzenie elementu ścieżki
-            segment_item = QGraphicsPathItem(path)
-            segment_item.setPen(QPen(Qt.NoPen))
-            segment_item.setBrush(QBrush(Qt.NoBrush))
-            
-            # Dodanie do sceny
-            scene.addItem(segment_item)
-            segment_item.setZValue(11)  # Pod orbitą ziemi
-            
             # Dodanie etykiety znaku
             if self.show_labels:
-                # Kąt środkowy znaku
-                mid_angle = math.radians(start_angle + span_angle / 2)
-                
-                # Pozycja etykiety
-                label_radius = zodiac_radius - zodiac_width / 2
-                label_x = center_x + label_radius * math.cos(mid_angle)
-                label_y = center_y + label_radius * math.sin(mid_angle)
+                label_x, label_y = label_points[i]
                 
                 # Utworzenie etykiety
-                label = QGraphicsTextItem(sign["name"])
+                label = QGraphicsSimpleTextItem(sign["name"])
                 
                 # Ustawienie czcionki i koloru
-                font = QFont("Arial", 6)
-                label.setFont(font)
-                label.setDefaultTextColor(QColor(255, 255, 255))
+                label.setFont(self._font_small)
+                label.setBrush(self._white_brush)
                 
-                # Obliczenie szerokości tekstu dla właściwego wyśrodkowania
-                text_width = label.boundingRect().width()
-                text_height = label.boundingRect().height()
+                # Rozmiar tekstu dla właściwego wyśrodkowania
+                text_width, text_height = self._label_sizes[sign["name"]]
                 
                 # Ustawienie pozycji z uwzględnieniem szerokości tekstu
                 label.setPos(label_x - text_width / 2, label_y - text_height / 2)
                 
-                # Dodanie do sceny
-                scene.addItem(label)
+                # Dodanie do warstwy statycznej
                 label.setZValue(12)
+                label.setParentItem(self._static_group)
+        
+        # Dodanie wszystkich segmentów jednym elementem
+        segments = QGraphicsPathItem(segments_path)
+        segments.setPen(self._no_pen)
+        segments.setBrush(self._no_brush)
+        segments.setZValue(11)  # Pod orbitą ziemi
+        segments.setParentItem(self._static_group)
     
-    def draw_earth_position(self, scene, center_x, center_y, inner_radius, outer_radius, position):
-        """Rysowanie aktualnej pozycji Ziemi na orbicie"""
-        # Średni promień pierścienia - to będzie promień orbity
-        orbit_radius = (inner_radius + outer_radius) / 2
-        
-        # Kąt pozycji Ziemi (w radianach)
-        angle = math.radians(position["angle"])
-        
-        # Obliczenie pozycji Ziemi na orbicie
-        earth_x = center_x + orbit_radius * math.cos(angle)
-        earth_y = center_y + orbit_radius * math.sin(angle)
-        
-        # Promień planety Ziemia
-        earth_radius = (outer_radius - inner_radius) * 0.15
-        
-        # Rysowanie Ziemi jako koła
-        earth = QGraphicsEllipseItem(
-            earth_x - earth_radius, earth_y - earth_radius,
-            earth_radius * 2, earth_radius * 2
-        )
-        
-        # Gradient dla Ziemi - niebieski z zielonymi kontynentami
-        gradient = QRadialGradient(earth_x, earth_y, earth_radius)
-        gradient.setColorAt(0, QColor(0, 100, 255))  # Niebieski (oceany)
-        gradient.setColorAt(0.5, QColor(0, 120, 255))
-        gradient.setColorAt(0.8, QColor(0, 80, 200))
-        
-        earth.setBrush(QBrush(Qt.NoBrush))
-        earth.setPen(QPen(QColor(255, 255, 255, 150), 1))
-        
-        # Dodanie do sceny
-        scene.addItem(earth)
-        earth.setZValue(20)  # Z-index dla Ziemi (wyższy niż wszystko inne)
-    
-    def draw_current_info(self, scene, center_x, center_y, inner_radius, outer_radius, position):
+    def draw_current_info(self, scene, center_x, center_y, geom, position):
         """Rysowanie informacji o aktualnej porze roku i znaku zodiaku"""
         if not self.show_details:
             return
@@ -493,21 +667,22 @@ class RokAstronomiczny:
         current_zodiac = position["current_zodiac"]
         
         # Tekst do wyświetlenia
-        info_text = f"Pora roku: {current_season['name']}\nZnak zodiaku: {current_zodiac['name']}"
+        season_line = f"Pora roku: {current_season['name']}"
+        zodiac_line = f"Znak zodiaku: {current_zodiac['name']}"
+        info_text = f"{season_line}\n{zodiac_line}"
         
         # Utworzenie pola tekstowego
-        info_display = QGraphicsTextItem(info_text)
+        info_display = QGraphicsSimpleTextItem(info_text)
         
         # Ustawienie czcionki i koloru
-        font = QFont("Arial", 8)
-        info_display.setFont(font)
-        info_display.setDefaultTextColor(QColor(255, 255, 255))
+        info_display.setFont(self._info_font)
+        info_display.setBrush(self._white_brush)
         
         # Pozycja tekstu - u dołu pierścienia
-        info_y = center_y + outer_radius * 0.8
+        info_y = center_y + geom["info_offset"]
         
-        # Obliczenie szerokości tekstu dla właściwego wyśrodkowania
-        text_width = info_display.boundingRect().width()
+        # Szerokość tekstu dla właściwego wyśrodkowania - szerszy z dwóch wierszy
+        text_width = max(self._info_line_widths[season_line], self._info_line_widths[zodiac_line])
         
         # Ustawienie pozycji
         info_display.setPos(center_x - text_width / 2, info_y)
@@ -5,12 +5,11 @@
 Główne okno aplikacji - zarządza wszystkimi komponentami UI
 """
 
-import sys
-from PyQt5.QtWidgets import (QMainWindow, QDockWidget, QAction, QToolBar, 
-                            QStatusBar, QLabel, QComboBox, QWidget, 
-                            QVBoxLayout, QHBoxLayout, QSplitter)
-from PyQt5.QtCore import Qt, QSize, QTimer
-from PyQt5.QtGui import QIcon, QPixmap
+import time
+from functools import partial
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QDockWidget, QAction, QToolBar, 
+                            QStatusBar, QLabel, QComboBox)
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QMetaObject, Q_ARG, pyqtSignal
 
 from widgets.koncentryczne_okregi import KoncentryczneOkregi
 from widgets.narzedzia import PasekNarzedzi
@@ -21,6 +20,9 @@ class MainWindow(QMainWindow):
     Zarządza wszystkimi elementami interfejsu użytkownika
     """
     
+    # Sygnał wspólnego zegara aplikacji - taktuje pasek statusu i wizualizację
+    clock_tick = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Aplikacja Czasowa")
@@ -29,16 +31,36 @@ class MainWindow(QMainWindow):
         # Inicjalizacja komponentów UI
         self.init_ui()
         
-        # Timer do aktualizacji statusu
+        # Tło sceny (gradient) zamalowuje cały widok - Qt nie musi czyścić go przed każdym malowaniem
+        self.koncentryczne_okregi.viewport().setAttribute(Qt.WA_OpaquePaintEvent, True)
+        
+        # Ostatnio wyświetlona sekunda w pasku statusu - formatowanie i setText tylko przy jej zmianie
+        self._last_second = None
+        
+        # Wspólny zegar statusu i wizualizacji - jednorazowy, przestawiany na granicę kolejnego taktu
+        # (takt wizualizacji dzieli sekundę, więc zmiana sekundy w pasku statusu wypada równo z taktem)
+        self.tick_interval = self.koncentryczne_okregi.update_interval
         self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Aktualizacja co sekundę
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self._tick_clock)
+        self.koncentryczne_okregi.use_external_clock(self.clock_tick)
+        
+        # Status synchronizacji aktualizowany zdarzeniowo - sygnał z modułu czasu atomowego
+        atomic_time = self.koncentryczne_okregi.systems['atomic_time']['instance']
+        if hasattr(atomic_time, 'sync_signals'):
+            atomic_time.sync_signals.sync_status_changed.connect(self._on_sync_changed, Qt.QueuedConnection)
+            self._on_sync_changed(atomic_time.is_synchronized())
+        
+        # Timer uruchamiany dopiero w showEvent i wstrzymywany, gdy okna nie widać
+        QApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
     
     def init_ui(self):
         """Inicjalizacja elementów interfejsu użytkownika"""
-        # Centralny widget - wizualizacja koncentrycznych okręgów
+        # Wstrzymanie odświeżania na czas budowy - jeden układ okna zamiast osobnego po każdym elemencie
+        self.setUpdatesEnabled(False)
+        
+        # Wizualizacja koncentrycznych okręgów - tworzona najpierw, bo podłączają się do niej akcje menu i paska
         self.koncentryczne_okregi = KoncentryczneOkregi(self)
-        self.setCentralWidget(self.koncentryczne_okregi)
         
         # Utworzenie menu
         self.create_menu()
@@ -50,6 +72,15 @@ class MainWindow(QMainWindow):
         self.create_sidebar()
         
         # Utworzenie paska statusu
+        self.create_statusbar()
+        
+        # Centralny widget ustawiany na końcu - jego geometria liczona raz, po dodaniu wszystkich pasków
+        self.setCentralWidget(self.koncentryczne_okregi)
+        
+        self.setUpdatesEnabled(True)
+    
+    def create_statusbar(self):
+        """Utworzenie paska statusu"""
         self.statusbar = QStatusBar(self)
         self.setStatusBar(self.statusbar)
         
@@ -60,6 +91,18 @@ class MainWindow(QMainWindow):
         # Dodanie widgetu synchronizacji w pasku statusu (po prawej)
         self.sync_label = QLabel("Synchronizacja: OK")
         self.statusbar.addPermanentWidget(self.sync_label)
+        
+        # Stała szerokość etykiet - zmiana tekstu co sekundę nie przebudowuje układu paska statusu
+        self.fix_label_width(self.status_label, ["Czas: 00:00:00"])
+        self.fix_label_width(self.sync_label, ["Synchronizacja: OK", "Synchronizacja: Błąd"])
+    
+    def fix_label_width(self, label, texts):
+        """Ustawienie stałej szerokości etykiety według najszerszego z możliwych tekstów"""
+        # Czcionka etykiety pochodzi z arkusza stylów, więc musi on zostać zastosowany przed pomiarem
+        label.ensurePolished()
+        label.setTextFormat(Qt.PlainText)
+        metrics = label.fontMetrics()
+        label.setFixedWidth(max(metrics.horizontalAdvance(text) for text in texts) + 16)
     
     def create_menu(self):
         """Utworzenie głównego menu aplikacji"""
@@ -93,11 +136,12 @@ class MainWindow(QMainWindow):
         for name, system_id in systems:
             action = QAction(name, self, checkable=True)
             action.setChecked(True)  # Domyślnie wszystkie systemy są włączone
-            action.triggered.connect(lambda checked, sys_id=system_id: 
-                                    self.koncentryczne_okregi.toggle_system(sys_id, checked))
-            time_systems_menu.addAction(action)
+            action.triggered.connect(partial(self._on_system_toggled, system_id))
             self.toggle_actions[system_id] = action
         
+        # Dodanie wszystkich akcji systemów jednym wywołaniem
+        time_systems_menu.addActions(list(self.toggle_actions.values()))
+        
         # Menu Ustawienia
         settings_menu = self.menuBar().addMenu("&Ustawienia")
         
@@ -105,13 +149,13 @@ class MainWindow(QMainWindow):
         timezone_action = QAction("&Strefa Czasowa", self)
         timezone_action.setStatusTip("Zmień strefę czasową")
         timezone_action.triggered.connect(self.change_timezone)
-        settings_menu.addAction(timezone_action)
         
         # Akcja Ustawienia Synchronizacji
         sync_action = QAction("&Ustawienia Synchronizacji", self)
         sync_action.setStatusTip("Konfiguruj serwery synchronizacji czasu")
         sync_action.triggered.connect(self.configure_sync)
-        settings_menu.addAction(sync_action)
+        
+        settings_menu.addActions([timezone_action, sync_action])
         
         # Menu Pomoc
         help_menu = self.menuBar().addMenu("Pomo&c")
@@ -122,6 +166,15 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def _dispatch_timezone(self, timezone):
+        """Przekazanie zmiany strefy czasowej przez kolejkę zdarzeń - lista rozwijana zamyka się bez czekania na przeliczenie"""
+        QMetaObject.invokeMethod(self.koncentryczne_okregi, "update_timezone", Qt.QueuedConnection,
+                                 Q_ARG(str, timezone))
+    
+    def _on_system_toggled(self, system_id, checked):
+        """Przełączenie systemu czasowego z menu Widok"""
+        self.koncentryczne_okregi.toggle_system(system_id, checked)
+    
     def create_toolbar(self):
         """Utworzenie paska narzędzi aplikacji"""
         self.toolbar = QToolBar("Główny pasek narzędzi")
@@ -142,12 +195,12 @@ class MainWindow(QMainWindow):
         zoom_in_action = QAction("Przybliż", self)
         zoom_in_action.setStatusTip("Przybliż widok")
         zoom_in_action.triggered.connect(self.koncentryczne_okregi.zoom_in)
-        self.toolbar.addAction(zoom_in_action)
         
         zoom_out_action = QAction("Oddal", self)
         zoom_out_action.setStatusTip("Oddal widok")
         zoom_out_action.triggered.connect(self.koncentryczne_okregi.zoom_out)
-        self.toolbar.addAction(zoom_out_action)
+        
+        self.toolbar.addActions([zoom_in_action, zoom_out_action])
         
         # Dodanie separatora
         self.toolbar.addSeparator()
@@ -156,9 +209,13 @@ class MainWindow(QMainWindow):
         self.toolbar.addWidget(QLabel("Strefa czasowa: "))
         
         self.timezone_combo = QComboBox()
+        
+        # Wypełnienie listy bez emisji sygnałów - update_timezone podłączane dopiero po zbudowaniu listy
+        self.timezone_combo.blockSignals(True)
         self.timezone_combo.addItems(["Lokalna", "UTC", "UTC+1", "UTC+2", "UTC-5", "UTC-8"])
         self.timezone_combo.setCurrentIndex(0)
-        self.timezone_combo.currentTextChanged.connect(self.koncentryczne_okregi.update_timezone)
+        self.timezone_combo.blockSignals(False)
+        self.timezone_combo.currentTextChanged.connect(self._dispatch_timezone)
         self.toolbar.addWidget(self.timezone_combo)
     
     def create_sidebar(self):
@@ -177,25 +234,82 @@ class MainWindow(QMainWindow):
         # Dodanie doku do głównego okna (po lewej stronie)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.sidebar_dock)
         
-        # Podłączenie sygnału przełączania systemów
-        self.koncentryczne_okregi.system_toggled.connect(self.pasek_narzedzi.update_checkbox)
+        # Zmiany stanu systemów zbierane i przekazywane do panelu jednorazowo w kolejnym obiegu pętli zdarzeń
+        self._pending_toggles = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_toggles)
+        
+        # Podłączenie sygnału przełączania systemów (odroczenie zapewnia już timer zbierający zmiany)
+        self.koncentryczne_okregi.system_toggled.connect(self._queue_toggle)
+    
+    def _queue_toggle(self, system_id, visible):
+        """Zapamiętanie zmiany stanu systemu - kolejne zmiany tego samego systemu nadpisują poprzednie"""
+        self._pending_toggles[system_id] = visible
+        self._flush_timer.start()
+    
+    def _flush_toggles(self):
+        """Przekazanie zebranych zmian stanu systemów do panelu bocznego w jednym przebiegu"""
+        self.pasek_narzedzi.setUpdatesEnabled(False)
+        for system_id, visible in self._pending_toggles.items():
+            self.pasek_narzedzi.update_checkbox(system_id, visible)
+        self._pending_toggles.clear()
+        self.pasek_narzedzi.setUpdatesEnabled(True)
+    
+    def is_status_visible(self):
+        """Sprawdzenie, czy pasek statusu jest widoczny dla użytkownika"""
+        return self.isVisible() and not (self.windowState() & Qt.WindowMinimized)
+    
+    def showEvent(self, event):
+        """Wznowienie aktualizacji statusu po pokazaniu okna"""
+        super().showEvent(event)
+        self._tick_clock()
     
-    def update_status(self):
-        """Aktualizacja paska statusu"""
-        # Aktualizacja czasu w pasku statusu
-        from datetime import datetime
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.status_label.setText(f"Czas: {current_time}")
+    def hideEvent(self, event):
+        """Wstrzymanie aktualizacji statusu po ukryciu okna"""
+        super().hideEvent(event)
+        self.status_timer.stop()
+    
+    def changeEvent(self, event):
+        """Wstrzymanie aktualizacji statusu przy minimalizacji okna i wznowienie po przywróceniu"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.is_status_visible():
+                self._tick_clock()
+            else:
+                self.status_timer.stop()
+    
+    def on_application_state_changed(self, state):
+        """Wstrzymanie aktualizacji statusu po uśpieniu aplikacji przez system"""
+        if state == Qt.ApplicationSuspended:
+            self.status_timer.stop()
+        elif state == Qt.ApplicationActive and not self.status_timer.isActive():
+            self._tick_clock()
+    
+    def _tick_clock(self):
+        """Takt wspólnego zegara - aktualizacja zegara w pasku statusu i emisja clock_tick"""
+        # Okno niewidoczne lub zminimalizowane - bez aktualizacji, timer wznowi showEvent/changeEvent
+        if not self.is_status_visible():
+            return
+        
+        # Aktualizacja czasu w pasku statusu - pozostałe takty w sekundzie nie dotykają etykiety
+        second = int(time.time())
+        if second != self._last_second:
+            self._last_second = second
+            self.status_label.setText(time.strftime("Czas: %H:%M:%S", time.localtime(second)))
         
-        # Aktualizacja statusu synchronizacji (dla czasu atomowego)
-        # W rzeczywistej aplikacji ta informacja pochodziłaby z modułu czasu atomowego
-        # Tutaj tylko symulujemy
-        sync_ok = True  # W rzeczywistej aplikacji byłoby to sprawdzane
+        # Odświeżenie wizualizacji w tym samym takcie
+        self.clock_tick.emit()
         
-        if sync_ok:
-            self.sync_label.setText("Synchronizacja: OK")
-        else:
-            self.sync_label.setText("Synchronizacja: Błąd")
+        # Kolejna aktualizacja na granicy następnego taktu - czas odczytany po rysowaniu,
+        # aby czas trwania klatki nie opóźniał kolejnych taktów
+        now_ms = int(time.time() * 1000)
+        self.status_timer.start(self.tick_interval - now_ms % self.tick_interval)
+    
+    def _on_sync_changed(self, ok):
+        """Aktualizacja statusu synchronizacji (dla czasu atomowego)"""
+        self.sync_label.setText("Synchronizacja: OK" if ok else "Synchronizacja: Błąd")
     
     def change_timezone(self):
         """Obsługa zmiany strefy czasowej"""
@@ -217,6 +331,27 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Obsługa zdarzenia zamknięcia okna"""
+        # Zatrzymanie timerów okna - bez ostatniej aktualizacji statusu w trakcie zamykania
+        self.status_timer.stop()
+        self._flush_timer.stop()
+        
+        # Odłączenie sygnałów - obiekty żyjące dłużej niż okno nie trzymają do niego referencji
+        atomic_time = self.koncentryczne_okregi.systems['atomic_time']['instance']
+        connections = [
+            (self.status_timer.timeout, self._tick_clock),
+            (QApplication.instance().applicationStateChanged, self.on_application_state_changed),
+            (self.koncentryczne_okregi.system_toggled, self._queue_toggle),
+        ]
+        if hasattr(atomic_time, 'sync_signals'):
+            connections.append((atomic_time.sync_signals.sync_status_changed, self._on_sync_changed))
+        for signal, slot in connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                # Sygnał nie był podłączony (np. przy ponownym zamknięciu okna)
+                pass
+        self.toggle_actions.clear()
+        
         # Czyszczenie zasobów przy zamknięciu
         self.koncentryczne_okregi.cleanup()
         event.accept()
\ No newline at end of file